@@ -80,8 +80,13 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+# Built once at import time so repeated main() invocations (tests, REPL use)
+# don't pay argparse construction cost on every call.
+_PARSER = build_parser()
+
+
 def main(argv=None) -> int:
-    args = build_parser().parse_args(argv)
+    args = _PARSER.parse_args(argv)
 
     # Build request_overrides
     request_overrides = {}
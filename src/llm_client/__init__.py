@@ -4,40 +4,29 @@ LLM client library for interacting with various LLM API providers.
 
 from .base import LLMProvider, LLMResponse
 from .retry import retry_request
-from .providers import (
-    OpenAIProvider,
-    OpenRouterProvider,
-    FireworksProvider,
-    ChutesProvider,
-    GoogleProvider,
-    GoogleAgentPlatformProvider,
-    TNGTechProvider,
-    XAIProvider,
-    MoonshotProvider,
-    StepfunProvider,
-    TinkerProvider,
-    LocalProvider,
-    CodexProvider,
-)
-
-# Convenient mapping of provider names to their implementations
-PROVIDER_MAP = {
-    "openai": OpenAIProvider,
-    "openrouter": OpenRouterProvider,
-    "fireworks": FireworksProvider,
-    "chutes": ChutesProvider,
-    "google": GoogleProvider,
-    "google_agent_platform": GoogleAgentPlatformProvider,
-    "tngtech": TNGTechProvider,
-    "xai": XAIProvider,
-    "moonshot": MoonshotProvider,
-    "stepfun": StepfunProvider,
-    "tinker": TinkerProvider,
-    "local": LocalProvider,
-    "openai_compatible": LocalProvider,
-    "codex": CodexProvider,
+
+# Provider name -> class name in llm_client.providers. The classes themselves
+# are imported lazily (PEP 562) so `import llm_client` does not drag in every
+# provider module when only one is needed.
+_PROVIDER_CLASS_NAMES = {
+    "openai": "OpenAIProvider",
+    "openrouter": "OpenRouterProvider",
+    "fireworks": "FireworksProvider",
+    "chutes": "ChutesProvider",
+    "google": "GoogleProvider",
+    "google_agent_platform": "GoogleAgentPlatformProvider",
+    "tngtech": "TNGTechProvider",
+    "xai": "XAIProvider",
+    "moonshot": "MoonshotProvider",
+    "stepfun": "StepfunProvider",
+    "tinker": "TinkerProvider",
+    "local": "LocalProvider",
+    "openai_compatible": "LocalProvider",
+    "codex": "CodexProvider",
 }
 
+_PROVIDER_EXPORTS = frozenset(_PROVIDER_CLASS_NAMES.values())
+
 __version__ = "0.1.30"
 
 
@@ -54,13 +43,39 @@ def get_provider(provider_name):
     Raises:
         ValueError: If the provider_name is not recognized
     """
-    if provider_name.lower() not in PROVIDER_MAP:
-        valid_providers = ", ".join(PROVIDER_MAP.keys())
+    class_name = _PROVIDER_CLASS_NAMES.get(provider_name.lower())
+    if class_name is None:
+        valid_providers = ", ".join(_PROVIDER_CLASS_NAMES.keys())
         raise ValueError(
             f"Unknown provider: '{provider_name}'. Valid providers are: {valid_providers}"
         )
 
-    return PROVIDER_MAP[provider_name.lower()]()
+    from . import providers
+
+    return getattr(providers, class_name)()
+
+
+def __getattr__(name):
+    if name == "PROVIDER_MAP":
+        from . import providers
+
+        provider_map = {
+            key: getattr(providers, class_name)
+            for key, class_name in _PROVIDER_CLASS_NAMES.items()
+        }
+        globals()["PROVIDER_MAP"] = provider_map
+        return provider_map
+    if name in _PROVIDER_EXPORTS:
+        from . import providers
+
+        value = getattr(providers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"PROVIDER_MAP"})
 
 
 __all__ = [
@@ -0,0 +1,43 @@
+"""
+Shared urllib3 connection pooling for LLM client providers.
+"""
+
+import os
+import threading
+
+import urllib3
+
+# Default number of connections kept alive per host; override with the
+# LLM_CLIENT_POOL_MAXSIZE environment variable for high-concurrency workloads.
+_DEFAULT_POOL_MAXSIZE = 32
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _pool_maxsize():
+    """Resolve the per-host pool size, falling back on bad or absent values."""
+    raw = os.getenv("LLM_CLIENT_POOL_MAXSIZE")
+    if raw:
+        try:
+            size = int(raw)
+            if size > 0:
+                return size
+        except ValueError:
+            pass
+    return _DEFAULT_POOL_MAXSIZE
+
+
+def get_pool():
+    """Return the shared urllib3 PoolManager, creating it on first use.
+
+    Reusing one PoolManager across requests keeps TCP connections and TLS
+    sessions alive between calls to the same API host, instead of paying a
+    fresh handshake on every request.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = urllib3.PoolManager(maxsize=_pool_maxsize(), block=False)
+    return _pool
@@ -3,7 +3,13 @@ Base classes for the LLM client library.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# HTTP status codes treated as retryable across all providers.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
 
 
 def finish_reason_normalization_evidence(source, value, normalized):
@@ -41,6 +47,17 @@ class LLMResponse:
         context (any): Optional context passed by the consumer
     """
 
+    __slots__ = (
+        "success",
+        "standardized_response",
+        "error_info",
+        "raw_provider_response",
+        "request_format",
+        "raw_response_format",
+        "is_retryable",
+        "context",
+    )
+
     def __init__(
         self,
         success=False,
@@ -67,6 +84,10 @@ class LLMProvider(ABC):
 
     def __init__(self):
         self._api_key = None
+        self._cached_headers = None
+        self._cached_headers_key = None
+        self._cached_stream_headers = None
+        self._cached_stream_headers_key = None
 
     def get_api_key(self):
         """Get the API key, retrieving from environment if not already cached"""
@@ -100,6 +121,71 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def amake_chat_completion_request(
+        self, messages, model_id, context=None, **options
+    ):
+        """
+        Async variant of make_chat_completion_request.
+
+        The default implementation runs the blocking request in a worker
+        thread via asyncio.to_thread, so callers can fan out many requests
+        on a single event loop with asyncio.gather. Providers with a native
+        async transport may override this.
+        """
+        return await asyncio.to_thread(
+            self.make_chat_completion_request,
+            messages,
+            model_id,
+            context=context,
+            **options,
+        )
+
+    def map_chat_completions(self, batches, model_id, max_workers=8, **options):
+        """
+        Fan out one chat completion per message list in batches, concurrently.
+
+        Requests run on a thread pool so wall-clock time approaches the
+        slowest round trip instead of the sum; the shared connection pool
+        serves all workers. Results are LLMResponse objects in the same
+        order as batches.
+
+        Args:
+            batches: Iterable of message lists, one per request
+            model_id: ID of the model to use for every request
+            max_workers: Maximum number of concurrent requests
+            **options: Additional provider-specific options applied to each
+
+        Returns:
+            list of LLMResponse objects, ordered to match batches
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda messages: self.make_chat_completion_request(
+                        messages, model_id, **options
+                    ),
+                    batches,
+                )
+            )
+
+    async def amake_request(
+        self,
+        messages,
+        model_id,
+        context=None,
+        request_format="chat_completions",
+        **options,
+    ):
+        """Async variant of make_request; see amake_chat_completion_request."""
+        return await asyncio.to_thread(
+            self.make_request,
+            messages,
+            model_id,
+            context=context,
+            request_format=request_format,
+            **options,
+        )
+
     def make_request(
         self,
         messages,
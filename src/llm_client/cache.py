@@ -0,0 +1,99 @@
+"""In-memory response caching for LLM API requests."""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from .base import LLMResponse
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TTL = 3600.0
+
+
+def make_cache_key(provider_name, model_id, messages, options):
+    """Build a stable digest identifying an exact-match request."""
+    payload = json.dumps(
+        {
+            "provider": provider_name,
+            "model": model_id,
+            "messages": messages,
+            "options": {k: options[k] for k in sorted(options)},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_cacheable_request(options):
+    """
+    Return True when a request is safe to serve from the cache.
+
+    Only deterministic requests qualify: the caller must pin temperature
+    to 0, and streaming transports are never cached.
+    """
+    if options.get("transport") == "stream":
+        return False
+    return options.get("temperature") == 0
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of successful LLMResponse objects with a TTL."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, context=None):
+        """Return a copy of the cached response for key, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # Hand back a fresh LLMResponse with deep-copied payloads so callers
+        # can attach their own context or mutate the result in place without
+        # poisoning the stored entry for later hits.
+        return LLMResponse(
+            success=response.success,
+            standardized_response=copy.deepcopy(response.standardized_response),
+            error_info=copy.deepcopy(response.error_info),
+            raw_provider_response=copy.deepcopy(response.raw_provider_response),
+            request_format=response.request_format,
+            raw_response_format=response.raw_response_format,
+            is_retryable=response.is_retryable,
+            context=context,
+        )
+
+    def put(self, key, response):
+        """Store a successful response; failures are never cached."""
+        if not isinstance(response, LLMResponse) or not response.success:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared default cache used by retry_request(use_cache=True).
+_default_cache = ResponseCache()
+
+
+def get_default_cache():
+    """Return the process-wide default ResponseCache."""
+    return _default_cache
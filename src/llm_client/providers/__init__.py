@@ -2,34 +2,41 @@
 Provider implementations for LLM client library.
 """
 
-from .openai import OpenAIProvider
-from .openrouter import OpenRouterProvider
-from .fireworks import FireworksProvider
-from .chutes import ChutesProvider
-from .google import GoogleProvider
-from .google_agent_platform import GoogleAgentPlatformProvider
-from .tngtech import TNGTechProvider
-from .xai import XAIProvider
-from .moonshot import MoonshotProvider
-from .stepfun import StepfunProvider
-from .tinker import TinkerProvider
-from .local import LocalProvider
-from .codex import CodexProvider
-from .openai_responses import OpenAIResponsesStyleProvider
+import importlib
 
-__all__ = [
-    "OpenAIProvider",
-    "OpenRouterProvider",
-    "FireworksProvider",
-    "ChutesProvider",
-    "GoogleProvider",
-    "GoogleAgentPlatformProvider",
-    "TNGTechProvider",
-    "XAIProvider",
-    "MoonshotProvider",
-    "StepfunProvider",
-    "TinkerProvider",
-    "LocalProvider",
-    "CodexProvider",
-    "OpenAIResponsesStyleProvider",
-]
+# Class name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562) so importing the package does not pull in every
+# provider when only one is needed.
+_PROVIDER_MODULES = {
+    "OpenAIProvider": ".openai",
+    "OpenRouterProvider": ".openrouter",
+    "FireworksProvider": ".fireworks",
+    "ChutesProvider": ".chutes",
+    "GoogleProvider": ".google",
+    "GoogleAgentPlatformProvider": ".google_agent_platform",
+    "TNGTechProvider": ".tngtech",
+    "XAIProvider": ".xai",
+    "MoonshotProvider": ".moonshot",
+    "StepfunProvider": ".stepfun",
+    "TinkerProvider": ".tinker",
+    "LocalProvider": ".local",
+    "CodexProvider": ".codex",
+    "OpenAIResponsesStyleProvider": ".openai_responses",
+}
+
+__all__ = list(_PROVIDER_MODULES)
+
+
+def __getattr__(name):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    # Cache so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
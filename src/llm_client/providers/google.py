@@ -4,15 +4,90 @@ Google provider implementation for LLM client.
 
 import json
 
-from ..base import LLMProvider, LLMResponse, with_finish_reason_metadata
+from urllib3 import exceptions as _u3_exceptions
+from urllib3.util import Timeout as _Timeout
+
+from .._http import get_pool
+from ..cache import ResponseCache, is_cacheable_request, make_cache_key
+from ..base import (
+    LLMProvider,
+    LLMResponse,
+    RETRYABLE_STATUS_CODES,
+    with_finish_reason_metadata,
+)
+
+try:
+    # orjson encodes straight to bytes and decodes bytes without an
+    # intermediate str, which matters for large Gemini payloads.
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 # API Endpoint Constants
 GOOGLE_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
 
+# Maximum-permissiveness safety settings, built once at import time. Never
+# mutated; shared across all requests.
+_SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+# Serialized once; spliced into fast-path request bodies
+_SAFETY_JSON = _json_dumps(_SAFETY_SETTINGS)
+
+# Opt-in cache for deterministic requests (cache=True with temperature == 0).
+_RESPONSE_CACHE = ResponseCache()
+
+# urllib3 exception groupings for error classification, resolved at import
+_TIMEOUT_EXCEPTIONS = (
+    _u3_exceptions.TimeoutError,
+    _u3_exceptions.ReadTimeoutError,
+    _u3_exceptions.ConnectTimeoutError,
+)
+_FATAL_NETWORK_EXCEPTIONS = (
+    _u3_exceptions.SSLError,
+    _u3_exceptions.LocationParseError,
+)
+
+# (exception classes, error type, retryable) checked in order; anything not
+# matched falls back to a retryable network_error
+_EXC_DISPATCH = (
+    (_TIMEOUT_EXCEPTIONS, "timeout", True),
+    (_FATAL_NETWORK_EXCEPTIONS, "network_error", False),
+)
+
+# Map Google finish reasons to the standardized vocabulary
+_FINISH_REASON_MAP = {
+    "STOP": "stop",
+    "MAX_TOKENS": "length",
+    "SAFETY": "content_filter",
+    "RECITATION": "content_filter",
+    "OTHER": "error",
+    "UNSPECIFIED": "error",
+}
+
 
 class GoogleProvider(LLMProvider):
     """Provider implementation for Google Gemini API"""
 
+    default_timeout = 60
+
+    def __init__(self):
+        super().__init__()
+        # model_id -> fully formed generateContent URL (includes the API key)
+        self._url_cache = {}
+        self._url_cache_key = None
+
     def _get_api_key_env_var(self):
         return "GEMINI_API_KEY"
 
@@ -30,43 +105,42 @@ class GoogleProvider(LLMProvider):
             LLMResponse object with standardized result
         """
         try:
-            # Get API key
+            # Prepare request URL (memoized per model; the URLs embed the API
+            # key, so key rotation is caught by the identity check and
+            # invalidates the whole cache)
             api_key = self.get_api_key()
-
-            # Prepare request URL
-            url = f"{GOOGLE_API_BASE}/models/{model_id}:generateContent?key={api_key}"
-
-            # Extract timeout if provided, otherwise default to 60 seconds
-            timeout = options.pop("timeout", 60)
+            if self._url_cache_key is not api_key:
+                self._url_cache.clear()
+                self._url_cache_key = api_key
+            url = self._url_cache.get(model_id)
+            if url is None:
+                url = f"{GOOGLE_API_BASE}/models/{model_id}:generateContent?key={api_key}"
+                self._url_cache[model_id] = url
+
+            # Read timeout without mutating the caller's options dict
+            timeout = options.get("timeout", self.default_timeout)
+
+            # Serve deterministic repeat requests from the opt-in cache
+            cache_key = None
+            if options.get("cache") and is_cacheable_request(options):
+                cache_key = make_cache_key(
+                    "google",
+                    model_id,
+                    messages,
+                    {k: v for k, v in options.items() if k != "cache"},
+                )
+                cached = _RESPONSE_CACHE.get(cache_key, context=context)
+                if cached is not None:
+                    return cached
 
             # Convert messages to Google's format
             google_messages = self._convert_messages_to_google_format(messages)
 
-            # Prepare the data payload
-            data = {"contents": google_messages}
-
-            # Add safety settings with maximum permissiveness
-            data["safetySettings"] = [
-                {"category": c, "threshold": "BLOCK_NONE"}
-                for c in [
-                    "HARM_CATEGORY_HARASSMENT",
-                    "HARM_CATEGORY_HATE_SPEECH",
-                    "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    "HARM_CATEGORY_DANGEROUS_CONTENT",
-                ]
-            ]
-
-            # Add any remaining options to the payload
-            for key, value in options.items():
-                if key not in data:
-                    data[key] = value
+            # Build the request body
+            body = self._build_request_body(google_messages, options)
 
             # Make the request via urllib3 (total timeout treated as overall budget)
-            import urllib3
-            from urllib3.util import Timeout as _Timeout
-
-            http = urllib3.PoolManager()
-            body = json.dumps(data).encode("utf-8")
+            http = get_pool()
             u3_timeout = (
                 _Timeout(total=float(timeout))
                 if isinstance(timeout, (int, float))
@@ -75,7 +149,11 @@ class GoogleProvider(LLMProvider):
             resp = http.request(
                 "POST",
                 url,
-                headers={"Content-Type": "application/json"},
+                # Accept compressed bodies; urllib3 decodes them transparently
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                },
                 body=body,
                 timeout=u3_timeout,
                 preload_content=True,
@@ -87,8 +165,8 @@ class GoogleProvider(LLMProvider):
 
             # Process successful response
             try:
-                raw_response = json.loads(resp.data.decode("utf-8", errors="ignore"))
-            except Exception:
+                raw_response = _json_loads(resp.data)
+            except (TypeError, ValueError):
                 raw_response = {}
 
             # Check for prompt feedback (indicates blocked input)
@@ -97,9 +175,17 @@ class GoogleProvider(LLMProvider):
             ):
                 return self._handle_prompt_blocked(raw_response, context)
 
-            # Google API can return content filter in different ways
-            if self._has_content_filter_error(raw_response):
-                error_info = self._extract_content_filter_error(raw_response)
+            # Bind the first candidate once; classification and
+            # standardization below both work from it
+            candidates = raw_response.get("candidates")
+            candidate0 = candidates[0] if candidates else None
+
+            # Google API can return content filter in different ways; classify
+            # the candidate once instead of probing it twice
+            kind, error_info = self._classify_response(
+                raw_response, candidate=candidate0
+            )
+            if kind != "ok":
                 return LLMResponse(
                     success=False,
                     error_info=error_info,
@@ -108,7 +194,9 @@ class GoogleProvider(LLMProvider):
                     context=context,
                 )
 
-            standardized_response = self._standardize_response(raw_response)
+            standardized_response = self._standardize_response(
+                raw_response, candidate=candidate0
+            )
 
             # Final sanity: if no content despite 200 and no explicit error, treat as non-retryable
             content_text = (standardized_response.get("content") or "").strip()
@@ -124,60 +212,61 @@ class GoogleProvider(LLMProvider):
                     context=context,
                 )
 
-            return LLMResponse(
+            response = LLMResponse(
                 success=True,
                 standardized_response=standardized_response,
                 raw_provider_response=raw_response,
                 is_retryable=False,
                 context=context,
             )
+            if cache_key is not None:
+                _RESPONSE_CACHE.put(cache_key, response)
+            return response
 
         except Exception as e:
             # Map urllib3 exceptions into retryable/non-retryable buckets
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                err_type = "timeout"
-                retryable = True
-            elif is_ssl or is_location:
-                err_type = "network_error"
-                retryable = False
-            else:
-                err_type = "network_error"
-                retryable = True
+            err_type, retryable = "network_error", True
+            for exc_types, kind, can_retry in _EXC_DISPATCH:
+                if isinstance(e, exc_types):
+                    err_type, retryable = kind, can_retry
+                    break
+            msg = str(e)
             return LLMResponse(
                 success=False,
-                error_info={"type": err_type, "message": str(e), "exception": str(e)},
+                error_info={"type": err_type, "message": msg, "exception": msg},
                 is_retryable=retryable,
                 context=context,
             )
-        except Exception as e:
-            # Handle unexpected errors
-            return LLMResponse(
-                success=False,
-                error_info={
-                    "type": "unexpected_error",
-                    "message": str(e),
-                    "exception": str(e),
-                },
-                is_retryable=False,  # Be conservative with unexpected errors
-                context=context,
+
+    def _build_request_body(self, google_messages, options):
+        """
+        Serialize the request payload to bytes.
+
+        The common case carries no extra options, so the payload shape is
+        fixed and the body can be spliced from the serialized contents and
+        the precomputed safety-settings fragment instead of building and
+        dumping a dict per request.
+        """
+        extras = {
+            key: value
+            for key, value in options.items()
+            if key not in ("timeout", "cache")
+        }
+        if not extras:
+            return (
+                b'{"contents":'
+                + _json_dumps(google_messages)
+                + b',"safetySettings":'
+                + _SAFETY_JSON
+                + b"}"
             )
 
+        data = {"contents": google_messages, "safetySettings": _SAFETY_SETTINGS}
+        for key, value in extras.items():
+            if key not in data:
+                data[key] = value
+        return _json_dumps(data)
+
     def _convert_messages_to_google_format(self, messages):
         """
         Convert standard chat message format to Google's format
@@ -188,6 +277,11 @@ class GoogleProvider(LLMProvider):
         Returns:
             List of message objects in Google's format
         """
+        # For the simplest (and most common) case of a single user message,
+        # skip the conversion loop entirely
+        if len(messages) == 1 and messages[0].get("role", "user") == "user":
+            return [{"parts": [{"text": messages[0].get("content", "")}]}]
+
         # For Google, we combine all messages into a single contents array
         google_messages = []
 
@@ -206,10 +300,6 @@ class GoogleProvider(LLMProvider):
                     {"role": google_role, "parts": [{"text": content}]}
                 )
 
-        # For the simplest case, if we only have one message, format it differently
-        if len(messages) == 1 and messages[0].get("role", "user") == "user":
-            return [{"parts": [{"text": messages[0].get("content", "")}]}]
-
         return google_messages
 
     def _handle_error_response(self, response, context):
@@ -217,7 +307,7 @@ class GoogleProvider(LLMProvider):
         status_code = getattr(response, "status", None)
         if status_code is None:
             status_code = getattr(response, "status_code", None)
-        is_retryable = status_code in [408, 425, 429, 500, 502, 503, 504]
+        is_retryable = status_code in RETRYABLE_STATUS_CODES
         error_text = None
         error_json = None
         try:
@@ -233,8 +323,8 @@ class GoogleProvider(LLMProvider):
             error_text = None
         if error_text:
             try:
-                error_json = json.loads(error_text)
-            except Exception:
+                error_json = _json_loads(error_text)
+            except (TypeError, ValueError):
                 error_json = None
 
         error_message = self._extract_error_message(error_json, error_text or "")
@@ -290,36 +380,33 @@ class GoogleProvider(LLMProvider):
             return str(error_obj)
         return f"Error: {response_text[:200]}"
 
-    def _has_content_filter_error(self, response):
-        """Check if the response contains a content filter error"""
-        # Check for safety issues in candidates
-        if "candidates" in response and len(response["candidates"]) > 0:
-            candidate = response["candidates"][0]
-            finish_reason = candidate.get("finishReason")
-            if finish_reason in ["SAFETY", "RECITATION", "OTHER"]:
-                return True
-
-        # Check for top-level error
-        if "error" in response:
-            return True
-
-        return False
+    def _classify_response(self, response, candidate=None):
+        """
+        Classify a 200 response in a single walk over the first candidate.
 
-    def _extract_content_filter_error(self, response):
-        """Extract content filter error from response"""
-        # Check for candidate-level issues
-        if "candidates" in response and len(response["candidates"]) > 0:
-            candidate = response["candidates"][0]
-            finish_reason = candidate.get("finishReason")
-            safety_ratings = candidate.get("safetyRatings", [])
-
-            if finish_reason:
-                return {
+        Callers that already hold the first candidate may pass it to avoid
+        re-deriving it. Returns a (kind, error_info) tuple where kind is
+        "ok", "content_filter", or "api_error". error_info is None when "ok".
+        """
+        if candidate is None:
+            candidates = response.get("candidates")
+            candidate = candidates[0] if candidates else None
+        finish_reason = candidate.get("finishReason") if candidate else None
+
+        has_error = "error" in response
+        if finish_reason not in ("SAFETY", "RECITATION", "OTHER") and not has_error:
+            return ("ok", None)
+
+        # Candidate-level issues take precedence over a top-level error
+        if finish_reason:
+            return (
+                "content_filter",
+                {
                     "type": "content_filter",
                     "message": f"Response stopped due to: {finish_reason}",
                     "finish_reason": "content_filter",
                     "native_finish_reason": finish_reason,
-                    "safety_ratings": safety_ratings,
+                    "safety_ratings": candidate.get("safetyRatings", []),
                     "normalization_evidence": {
                         "finish_reason": {
                             "source": "candidates[0].finishReason",
@@ -327,20 +414,38 @@ class GoogleProvider(LLMProvider):
                             "normalized": "content_filter",
                         }
                     },
-                }
+                },
+            )
 
-        # Check for top-level error
-        if "error" in response:
+        if has_error:
             error_obj = response["error"]
-            message = error_obj.get("message", "Unknown Google API error")
-            error_code = error_obj.get("code")
-
-            return {"type": "api_error", "message": message, "code": error_code}
+            return (
+                "api_error",
+                {
+                    "type": "api_error",
+                    "message": error_obj.get("message", "Unknown Google API error"),
+                    "code": error_obj.get("code"),
+                },
+            )
 
         # Fallback
-        return {"type": "content_filter", "message": "Unknown content filter issue"}
+        return (
+            "content_filter",
+            {"type": "content_filter", "message": "Unknown content filter issue"},
+        )
 
-    def _standardize_response(self, provider_response):
+    def _has_content_filter_error(self, response):
+        """Check if the response contains a content filter error"""
+        return self._classify_response(response)[0] != "ok"
+
+    def _extract_content_filter_error(self, response):
+        """Extract content filter error from response"""
+        error_info = self._classify_response(response)[1]
+        if error_info is None:
+            return {"type": "content_filter", "message": "Unknown content filter issue"}
+        return error_info
+
+    def _standardize_response(self, provider_response, candidate=None):
         """Convert Google response to standardized format"""
         standardized = {
             "id": None,  # Google doesn't provide an ID like OpenAI
@@ -361,23 +466,13 @@ class GoogleProvider(LLMProvider):
             }
 
         # Extract content from the first candidate
-        if (
-            "candidates" in provider_response
-            and len(provider_response["candidates"]) > 0
-        ):
-            candidate = provider_response["candidates"][0]
+        if candidate is None:
+            candidates = provider_response.get("candidates")
+            candidate = candidates[0] if candidates else None
+        if candidate is not None:
             finish_reason_raw = candidate.get("finishReason")
 
-            # Map Google finish reasons to standard format
-            reason_map = {
-                "STOP": "stop",
-                "MAX_TOKENS": "length",
-                "SAFETY": "content_filter",
-                "RECITATION": "content_filter",
-                "OTHER": "error",
-                "UNSPECIFIED": "error",
-            }
-            normalized_finish_reason = reason_map.get(
+            normalized_finish_reason = _FINISH_REASON_MAP.get(
                 finish_reason_raw,
                 finish_reason_raw.lower() if finish_reason_raw else None,
             )
@@ -388,19 +483,15 @@ class GoogleProvider(LLMProvider):
                 normalized=normalized_finish_reason,
             )
 
-            # Extract text content
-            if (
-                "content" in candidate
-                and "parts" in candidate["content"]
-                and isinstance(candidate["content"]["parts"], list)
-                and len(candidate["content"]["parts"]) > 0
-            ):
-                standardized["content"] = "".join(
-                    [
-                        part.get("text", "")
-                        for part in candidate["content"]["parts"]
-                        if "text" in part
-                    ]
-                )
+            # Extract text content in a single pass over the parts
+            content = candidate.get("content")
+            parts = content.get("parts") if isinstance(content, dict) else None
+            if isinstance(parts, list) and parts:
+                buf = []
+                append = buf.append
+                for part in parts:
+                    if "text" in part:
+                        append(part["text"])
+                standardized["content"] = "".join(buf)
 
         return standardized
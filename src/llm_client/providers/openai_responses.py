@@ -5,7 +5,19 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Iterable, Optional
 
-from ..base import LLMProvider, LLMResponse, with_finish_reason_metadata
+from urllib3.util import Timeout as U3Timeout
+
+from .._http import get_pool
+from ..base import (
+    LLMProvider,
+    LLMResponse,
+    RETRYABLE_STATUS_CODES,
+    with_finish_reason_metadata,
+)
+
+# Error bodies beyond this size are kept as a truncated message head only;
+# anything that large is proxy/HTML noise rather than a JSON error payload.
+_MAX_ERROR_BODY_BYTES = 64 * 1024
 
 
 class OpenAIResponsesStyleProvider(LLMProvider):
@@ -109,10 +121,7 @@ class OpenAIResponsesStyleProvider(LLMProvider):
 
         use_stream = bool(data.get("stream"))
         try:
-            import urllib3
-            from urllib3.util import Timeout as U3Timeout
-
-            response = urllib3.PoolManager().request(
+            response = get_pool().request(
                 "POST",
                 self._get_responses_url(),
                 body=json.dumps(data).encode("utf-8"),
@@ -434,13 +443,18 @@ class OpenAIResponsesStyleProvider(LLMProvider):
             raw_provider_response=event,
             request_format="responses",
             raw_response_format="openai.responses.error",
-            is_retryable=status_code in {408, 425, 429, 500, 502, 503, 504},
+            is_retryable=status_code in RETRYABLE_STATUS_CODES,
             context=context,
         )
 
     def _handle_responses_http_error(self, response, context) -> LLMResponse:
         raw = getattr(response, "data", b"") or b""
-        text = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else str(raw)
+        if isinstance(raw, bytes):
+            # Decode only a bounded head; huge error bodies are proxy/HTML
+            # noise and would otherwise cost a full-body UTF-8 pass.
+            text = raw[:_MAX_ERROR_BODY_BYTES].decode("utf-8", errors="replace")
+        else:
+            text = str(raw)[:_MAX_ERROR_BODY_BYTES]
         try:
             payload = json.loads(text)
         except json.JSONDecodeError:
@@ -459,7 +473,7 @@ class OpenAIResponsesStyleProvider(LLMProvider):
             raw_provider_response=payload,
             request_format="responses",
             raw_response_format="openai.responses.error",
-            is_retryable=status in {408, 425, 429, 500, 502, 503, 504},
+            is_retryable=status in RETRYABLE_STATUS_CODES,
             context=context,
         )
 
@@ -2,10 +2,107 @@
 Shared base implementation for OpenAI-compatible providers.
 """
 
+import asyncio
 import json
 from typing import Any, Dict, Optional
 
-from ..base import LLMProvider, LLMResponse, with_finish_reason_metadata
+from urllib3 import exceptions as _u3_exceptions
+from urllib3.util import Timeout as _Timeout
+
+from .._http import get_pool
+from ..cache import ResponseCache, is_cacheable_request, make_cache_key
+from ..base import (
+    LLMProvider,
+    LLMResponse,
+    RETRYABLE_STATUS_CODES,
+    with_finish_reason_metadata,
+)
+
+try:
+    # Optional fast path: orjson serializes straight to bytes and parses bytes
+    # without an intermediate str, which matters for large chat payloads.
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    # Optional native async transport; without it the async entry points fall
+    # back to running the blocking request in a worker thread.
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only with aiohttp installed
+    aiohttp = None
+
+# Option keys consumed by the client itself; everything else is passed
+# through to the provider payload untouched.
+_RESERVED_OPTIONS = frozenset({"timeout", "max_tokens", "transport", "stream", "cache"})
+
+# Payload keys the client owns outright; caller options never overwrite these,
+# so the body built from the call arguments is authoritative.
+_NON_PASSTHROUGH_OPTIONS = _RESERVED_OPTIONS | {"model", "messages"}
+
+# urllib3 exception groupings for error classification, resolved at import
+_TIMEOUT_EXCEPTIONS = (
+    _u3_exceptions.TimeoutError,
+    _u3_exceptions.ReadTimeoutError,
+    _u3_exceptions.ConnectTimeoutError,
+)
+_FATAL_NETWORK_EXCEPTIONS = (
+    _u3_exceptions.SSLError,
+    _u3_exceptions.LocationParseError,
+)
+
+# Opt-in cache for deterministic requests (cache=True with temperature == 0).
+_RESPONSE_CACHE = ResponseCache()
+
+# Error bodies beyond this size are kept as a truncated message head only;
+# anything that large is proxy/HTML noise rather than a JSON error payload.
+_MAX_ERROR_BODY_BYTES = 64 * 1024
+
+
+class _BufferedResponse:
+    """Minimal response shim (status + body bytes) for shared post-processing."""
+
+    __slots__ = ("status", "data")
+
+    def __init__(self, status, data):
+        self.status = status
+        self.data = data
+
+
+def _extract_delta(event, finish_reason):
+    """
+    Shape-specialized extractor for OpenAI-style streaming events.
+
+    Returns (choice0, content_piece, finish_reason): choice0 is None when the
+    event carries no choices, content_piece is the text delta (falling back to
+    a full streamed message), and finish_reason keeps the passed-in value when
+    the event does not update it. Schema oddities are swallowed.
+    """
+    choice0 = None
+    content_piece = None
+    try:
+        choices = event.get("choices")
+        if choices:
+            choice0 = choices[0]
+            finish_reason = choice0.get("finish_reason", finish_reason)
+            delta = choice0.get("delta")
+            if delta:
+                content_piece = delta.get("content")
+            if not content_piece:
+                # Some providers stream full messages per chunk
+                msg = choice0.get("message")
+                if isinstance(msg, dict):
+                    content_piece = msg.get("content")
+    except Exception:
+        content_piece = None
+    return choice0, content_piece, finish_reason
 
 
 class OpenAIStyleProvider(LLMProvider):
@@ -17,6 +114,14 @@ class OpenAIStyleProvider(LLMProvider):
     default_timeout: int = 60
     default_max_tokens: int = 4096
 
+    def __init__(self):
+        super().__init__()
+        # Endpoint URL memo per api_base; subclasses like LocalProvider can
+        # resolve a different base per request, so this is a dict, not a slot.
+        self._url_cache: Dict[str, str] = {}
+        # event loop -> aiohttp.ClientSession, created lazily on first use
+        self._aio_sessions: Dict[Any, Any] = {}
+
     def _get_api_key_env_var(self) -> str:
         if not self.api_key_env_var:
             raise NotImplementedError("Subclasses must define 'api_key_env_var'")
@@ -33,23 +138,70 @@ class OpenAIStyleProvider(LLMProvider):
         return self.provider_name
 
     def _build_request_headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.get_api_key()}",
-            "Content-Type": "application/json",
-        }
+        # Built once per key: the cache is validated against the key object so
+        # rotating self._api_key on a live instance rebuilds the headers.
+        key = self.get_api_key()
+        if self._cached_headers is None or self._cached_headers_key is not key:
+            self._cached_headers = {
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
+            }
+            self._cached_headers_key = key
+            self._cached_stream_headers = None
+        return self._cached_headers
+
+    def _build_stream_request_headers(self) -> Dict[str, str]:
+        # Streaming variant of the cached headers, validated against the key
+        # here rather than in _build_request_headers so subclasses that
+        # override the base builder still pick up key rotation.
+        key = self.get_api_key()
+        if (
+            self._cached_stream_headers is None
+            or self._cached_stream_headers_key is not key
+        ):
+            self._cached_stream_headers = {
+                **self._build_request_headers(),
+                "Accept": "text/event-stream",
+            }
+            self._cached_stream_headers_key = key
+        return self._cached_stream_headers
 
     def _get_chat_completions_url(self, api_base: Optional[str] = None) -> str:
-        return f"{(api_base or self._get_api_base()).rstrip('/')}/chat/completions"
+        base = api_base or self._get_api_base()
+        url = self._url_cache.get(base)
+        if url is None:
+            url = f"{base.rstrip('/')}/chat/completions"
+            self._url_cache[base] = url
+        return url
 
     def _resolve_chat_completion_target(self, model_id: str) -> tuple[str, str]:
         """Return the API base and model ID to send for this request."""
         return self._get_api_base().rstrip("/"), model_id
 
+    def preconnect(self) -> bool:
+        """
+        Warm up a pooled connection to the provider ahead of the first request.
+
+        Issues a lightweight GET to the /models endpoint so the TCP/TLS
+        handshake is paid before latency-sensitive traffic hits the pool.
+        Failures are swallowed; returns True when any HTTP response arrived.
+        """
+        try:
+            resp = get_pool().request(
+                "GET",
+                f"{self._get_api_base().rstrip('/')}/models",
+                headers=self._build_request_headers(),
+                timeout=_Timeout(total=10.0),
+            )
+            return resp.status is not None
+        except Exception:
+            return False
+
     def make_chat_completion_request(
         self, messages, model_id, context=None, **options
     ) -> LLMResponse:
-        timeout = options.pop("timeout", self.default_timeout)
-        max_tokens = options.pop("max_tokens", self.default_max_tokens)
+        timeout = options.get("timeout", self.default_timeout)
+        max_tokens = options.get("max_tokens", self.default_max_tokens)
         try:
             api_base, request_model_id = self._resolve_chat_completion_target(model_id)
         except ValueError as e:
@@ -67,8 +219,8 @@ class OpenAIStyleProvider(LLMProvider):
         # Supported interface: transport='stream'.
         # If the caller provides stream=True without transport='stream', raise an error
         # because we don't expose token-by-token streaming.
-        transport = options.pop("transport", None)
-        user_stream_flag = options.pop("stream", None)
+        transport = options.get("transport")
+        user_stream_flag = options.get("stream")
         if user_stream_flag and transport != "stream":
             return LLMResponse(
                 success=False,
@@ -81,30 +233,50 @@ class OpenAIStyleProvider(LLMProvider):
             )
         use_stream_transport = transport == "stream"
 
+        # Serve deterministic repeat requests from the opt-in cache
+        cache_key = None
+        if (
+            options.get("cache")
+            and not use_stream_transport
+            and is_cacheable_request(options)
+        ):
+            cache_key = make_cache_key(
+                self._get_provider_name(),
+                request_model_id,
+                messages,
+                {k: v for k, v in options.items() if k != "cache"},
+            )
+            cached = _RESPONSE_CACHE.get(cache_key, context=context)
+            if cached is not None:
+                return cached
+
         data: Dict[str, Any] = {
             "model": request_model_id,
             "messages": messages,
             "max_tokens": max_tokens,
         }
-        if options:
-            data.update(options)
+        extras = {k: v for k, v in options.items() if k not in _NON_PASSTHROUGH_OPTIONS}
+        if extras:
+            data.update(extras)
 
         # If using streaming transport, set provider stream flag (we manage this internally)
         if use_stream_transport:
             data["stream"] = True
 
+        # Resolve the endpoint once for either transport below
+        url = self._get_chat_completions_url(api_base)
+
         try:
-            headers = self._build_request_headers()
-            if use_stream_transport:
-                headers = {**headers, "Accept": "text/event-stream"}
+            headers = (
+                self._build_stream_request_headers()
+                if use_stream_transport
+                else self._build_request_headers()
+            )
 
             if use_stream_transport:
                 # Use urllib3 to enforce an overall timeout for the full request
-                import urllib3
-                from urllib3.util import Timeout as _Timeout
-
-                http = urllib3.PoolManager()
-                body_bytes = json.dumps(data).encode("utf-8")
+                http = get_pool()
+                body_bytes = _json_dumps(data)
                 total_timeout = None
                 # Interpret numeric timeout as overall total; if tuple provided, approximate with sum
                 if isinstance(timeout, tuple) and len(timeout) == 2:
@@ -119,7 +291,7 @@ class OpenAIStyleProvider(LLMProvider):
                 )
                 u3_resp = http.request(
                     "POST",
-                    self._get_chat_completions_url(api_base),
+                    url,
                     body=body_bytes,
                     headers=headers,
                     preload_content=False,
@@ -143,19 +315,15 @@ class OpenAIStyleProvider(LLMProvider):
                         success=False,
                         error_info=error_info,
                         raw_provider_response=None,
-                        is_retryable=u3_resp.status
-                        in [408, 425, 429, 500, 502, 503, 504],
+                        is_retryable=u3_resp.status in RETRYABLE_STATUS_CODES,
                         context=context,
                     )
 
                 return self._consume_streaming_response_urllib3(u3_resp, context)
 
             # Non-streaming path uses urllib3 as well
-            import urllib3
-            from urllib3.util import Timeout as _Timeout
-
-            http = urllib3.PoolManager()
-            body_bytes = json.dumps(data).encode("utf-8")
+            http = get_pool()
+            body_bytes = _json_dumps(data)
             u3_timeout = (
                 _Timeout(total=float(timeout))
                 if isinstance(timeout, (int, float))
@@ -163,184 +331,517 @@ class OpenAIStyleProvider(LLMProvider):
             )
             u3_resp = http.request(
                 "POST",
-                self._get_chat_completions_url(api_base),
+                url,
                 body=body_bytes,
                 headers=headers,
                 preload_content=True,
                 timeout=u3_timeout,
             )
 
-            if u3_resp.status != 200:
-                return self._handle_error_response(u3_resp, context)
+            response = self._handle_buffered_response(u3_resp, context)
+            if cache_key is not None:
+                _RESPONSE_CACHE.put(cache_key, response)
+            return response
 
+        except Exception as e:
+            # Map urllib3 exceptions to retryable/non-retryable
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
+            else:
+                err_type, retryable = "network_error", True
+            msg = str(e)
+            return LLMResponse(
+                success=False,
+                error_info={
+                    "type": err_type,
+                    "message": msg,
+                    "exception": msg,
+                },
+                is_retryable=retryable,
+                context=context,
+            )
+
+    def iter_chat_completion(self, messages, model_id, context=None, **options):
+        """
+        Stream a chat completion, yielding content fragments as they arrive.
+
+        Yields each decoded content piece (str) as soon as its SSE event is
+        parsed, then yields exactly one final LLMResponse aggregating the
+        full stream. Errors surface as that final LLMResponse rather than
+        raising, matching make_chat_completion_request's contract.
+        """
+        timeout = options.get("timeout", self.default_timeout)
+        max_tokens = options.get("max_tokens", self.default_max_tokens)
+        try:
+            api_base, request_model_id = self._resolve_chat_completion_target(model_id)
+        except ValueError as e:
+            yield LLMResponse(
+                success=False,
+                error_info={
+                    "type": "invalid_option",
+                    "message": str(e),
+                },
+                is_retryable=False,
+                context=context,
+            )
+            return
+
+        data: Dict[str, Any] = {
+            "model": request_model_id,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+        extras = {k: v for k, v in options.items() if k not in _NON_PASSTHROUGH_OPTIONS}
+        if extras:
+            data.update(extras)
+
+        url = self._get_chat_completions_url(api_base)
+        try:
+            if isinstance(timeout, tuple) and len(timeout) == 2:
+                total_timeout = float(timeout[0]) + float(timeout[1])
+            elif isinstance(timeout, (int, float)):
+                total_timeout = float(timeout)
+            else:
+                total_timeout = None
+            u3_resp = get_pool().request(
+                "POST",
+                url,
+                body=_json_dumps(data),
+                headers=self._build_stream_request_headers(),
+                preload_content=False,
+                timeout=_Timeout(total=total_timeout),
+            )
+        except Exception as e:
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
+            else:
+                err_type, retryable = "network_error", True
+            msg = str(e)
+            yield LLMResponse(
+                success=False,
+                error_info={
+                    "type": err_type,
+                    "message": msg,
+                    "exception": msg,
+                },
+                is_retryable=retryable,
+                context=context,
+            )
+            return
+
+        if u3_resp.status != 200:
             try:
-                raw_response = json.loads(u3_resp.data.decode("utf-8", errors="ignore"))
+                err_text = u3_resp.read(1024).decode("utf-8", errors="ignore")
             except Exception:
-                raw_response = {}
+                err_text = ""
+            yield LLMResponse(
+                success=False,
+                error_info={
+                    "type": "api_error",
+                    "status_code": u3_resp.status,
+                    "message": f"Error (HTTP {u3_resp.status}): {err_text[:200]}",
+                    "raw_response": err_text,
+                },
+                raw_provider_response=None,
+                is_retryable=u3_resp.status in RETRYABLE_STATUS_CODES,
+                context=context,
+            )
+            return
 
-            if isinstance(raw_response, dict) and "error" in raw_response:
-                error_message = self._extract_error_message(raw_response, u3_resp)
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "api_error",
-                        "status_code": getattr(u3_resp, "status", None),
-                        "message": error_message,
-                        "raw_response": u3_resp.data.decode("utf-8", errors="ignore")
-                        if getattr(u3_resp, "data", None)
-                        else "",
-                    },
-                    raw_provider_response=raw_response,
-                    is_retryable=False,
-                    context=context,
-                )
+        yield from self._iter_streaming_events_urllib3(u3_resp, context)
 
-            if self._has_content_filter_error(raw_response):
-                error_info = self._extract_content_filter_error(raw_response)
-                return LLMResponse(
-                    success=False,
-                    error_info=error_info,
-                    raw_provider_response=raw_response,
-                    is_retryable=False,
-                    context=context,
-                )
+    def _handle_buffered_response(self, resp, context) -> LLMResponse:
+        """Turn a fully buffered HTTP response (status + data) into an LLMResponse."""
+        if resp.status != 200:
+            return self._handle_error_response(resp, context)
 
-            standardized_response = self._standardize_response(raw_response)
+        try:
+            raw_response = _json_loads(resp.data)
+        except Exception:
+            raw_response = {}
 
-            # Final sanity: if no content despite 200 and no explicit error, treat as non-retryable
-            content_text = (standardized_response.get("content") or "").strip()
-            if content_text == "":
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "content_filter",
-                        "message": "Response contained no content.",
-                    },
-                    raw_provider_response=raw_response,
-                    is_retryable=False,
-                    context=context,
-                )
+        if isinstance(raw_response, dict) and "error" in raw_response:
+            error_message = self._extract_error_message(
+                raw_response, resp.status, None
+            )
+            return LLMResponse(
+                success=False,
+                error_info={
+                    "type": "api_error",
+                    "status_code": resp.status,
+                    "message": error_message,
+                    "raw_response": resp.data.decode("utf-8", errors="ignore")
+                    if resp.data
+                    else "",
+                },
+                raw_provider_response=raw_response,
+                is_retryable=False,
+                context=context,
+            )
 
+        if self._has_content_filter_error(raw_response):
+            error_info = self._extract_content_filter_error(raw_response)
             return LLMResponse(
-                success=True,
-                standardized_response=standardized_response,
+                success=False,
+                error_info=error_info,
+                raw_provider_response=raw_response,
+                is_retryable=False,
+                context=context,
+            )
+
+        standardized_response = self._standardize_response(raw_response)
+
+        # Final sanity: if no content despite 200 and no explicit error, treat as non-retryable
+        content_text = (standardized_response.get("content") or "").strip()
+        if content_text == "":
+            return LLMResponse(
+                success=False,
+                error_info={
+                    "type": "content_filter",
+                    "message": "Response contained no content.",
+                },
                 raw_provider_response=raw_response,
                 is_retryable=False,
                 context=context,
             )
 
+        return LLMResponse(
+            success=True,
+            standardized_response=standardized_response,
+            raw_provider_response=raw_response,
+            is_retryable=False,
+            context=context,
+        )
+
+    def _get_aio_session(self):
+        """
+        Return an aiohttp.ClientSession bound to the running event loop.
+
+        Sessions are cached per loop so repeated async requests reuse
+        connections, mirroring the shared urllib3 pool on the sync path.
+        Timeouts are passed per request, so one session serves them all.
+        """
+        loop = asyncio.get_running_loop()
+        # Evict entries whose loop has closed (e.g. repeated asyncio.run
+        # calls) so dead sessions do not accumulate across loops.
+        for cached_loop in list(self._aio_sessions):
+            if cached_loop.is_closed():
+                del self._aio_sessions[cached_loop]
+        session = self._aio_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession()
+            self._aio_sessions[loop] = session
+        return session
+
+    async def aclose(self) -> None:
+        """
+        Close any cached aiohttp sessions held by this provider.
+
+        Call this from async code when done issuing async requests to
+        release keep-alive connections cleanly. Sync-only usage never
+        creates sessions and does not need it.
+        """
+        sessions, self._aio_sessions = self._aio_sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+
+    async def amake_chat_completion_request(
+        self, messages, model_id, context=None, **options
+    ) -> LLMResponse:
+        """
+        Async variant of make_chat_completion_request.
+
+        When aiohttp is installed, non-streaming requests are issued natively
+        on the event loop; streaming transports (and installs without aiohttp)
+        fall back to the thread-based default from LLMProvider.
+        """
+        if (
+            aiohttp is None
+            or options.get("transport") == "stream"
+            or options.get("stream")
+        ):
+            return await super().amake_chat_completion_request(
+                messages, model_id, context=context, **options
+            )
+
+        timeout = options.get("timeout", self.default_timeout)
+        max_tokens = options.get("max_tokens", self.default_max_tokens)
+        try:
+            api_base, request_model_id = self._resolve_chat_completion_target(model_id)
+        except ValueError as e:
+            return LLMResponse(
+                success=False,
+                error_info={"type": "invalid_option", "message": str(e)},
+                is_retryable=False,
+                context=context,
+            )
+
+        data: Dict[str, Any] = {
+            "model": request_model_id,
+            "messages": messages,
+            "max_tokens": max_tokens,
+        }
+        extras = {k: v for k, v in options.items() if k not in _NON_PASSTHROUGH_OPTIONS}
+        if extras:
+            data.update(extras)
+
+        total_timeout = None
+        if isinstance(timeout, tuple) and len(timeout) == 2:
+            total_timeout = float(timeout[0]) + float(timeout[1])
+        elif isinstance(timeout, (int, float)):
+            total_timeout = float(timeout)
+
+        try:
+            headers = self._build_request_headers()
+            client_timeout = aiohttp.ClientTimeout(total=total_timeout)
+            session = self._get_aio_session()
+            async with session.post(
+                self._get_chat_completions_url(api_base),
+                data=_json_dumps(data),
+                headers=headers,
+                timeout=client_timeout,
+            ) as aio_resp:
+                body = await aio_resp.read()
+                status = aio_resp.status
+            return self._handle_buffered_response(
+                _BufferedResponse(status, body), context
+            )
+        except asyncio.TimeoutError as e:
+            msg = str(e)
+            return LLMResponse(
+                success=False,
+                error_info={"type": "timeout", "message": msg, "exception": msg},
+                is_retryable=True,
+                context=context,
+            )
         except Exception as e:
-            # Map urllib3 exceptions to retryable/non-retryable
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "timeout",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=True,
-                    context=context,
-                )
-            if is_ssl or is_location:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "network_error",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=False,
-                    context=context,
-                )
+            msg = str(e)
             return LLMResponse(
                 success=False,
                 error_info={
                     "type": "network_error",
-                    "message": str(e),
-                    "exception": str(e),
+                    "message": msg,
+                    "exception": msg,
                 },
                 is_retryable=True,
                 context=context,
             )
 
+    # ------------------------- Batch API (OpenAI) -------------------------
+
+    def _supports_batch_api(self) -> bool:
+        """The Batch API is only offered on the official OpenAI API base."""
+        return "api.openai.com" in (self.api_base or "")
+
+    def _require_batch_api(self) -> str:
+        if not self._supports_batch_api():
+            raise ValueError(
+                f"The Batch API is not supported for provider "
+                f"'{self._get_provider_name()}' (api_base={self.api_base})"
+            )
+        return self._get_api_base().rstrip("/")
+
+    def submit_batch(self, items, completion_window: str = "24h") -> str:
+        """
+        Submit a bulk chat-completions batch via the OpenAI Batch API.
+
+        Each item is a chat-completions request body (model, messages, and
+        any extras) with an optional 'custom_id' used to correlate results.
+        The items are serialized to JSONL, uploaded to /files with
+        purpose=batch, and a /batches job is created.
+
+        Returns:
+            The batch id to pass to poll_batch / fetch_batch_results.
+        """
+        api_base = self._require_batch_api()
+        auth_header = {"Authorization": f"Bearer {self.get_api_key()}"}
+
+        lines = []
+        for index, item in enumerate(items):
+            body = {k: v for k, v in item.items() if k != "custom_id"}
+            body.setdefault("max_tokens", self.default_max_tokens)
+            lines.append(
+                _json_dumps(
+                    {
+                        "custom_id": item.get("custom_id", f"request-{index}"),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        http = get_pool()
+        upload = http.request(
+            "POST",
+            f"{api_base}/files",
+            fields={
+                "purpose": "batch",
+                "file": ("batch.jsonl", b"\n".join(lines), "application/jsonl"),
+            },
+            headers=auth_header,
+        )
+        if upload.status != 200:
+            raise RuntimeError(
+                f"Batch file upload failed (HTTP {upload.status}): "
+                f"{upload.data.decode('utf-8', errors='ignore')[:200]}"
+            )
+        file_id = _json_loads(upload.data)["id"]
+
+        created = http.request(
+            "POST",
+            f"{api_base}/batches",
+            body=_json_dumps(
+                {
+                    "input_file_id": file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": completion_window,
+                }
+            ),
+            headers={**auth_header, "Content-Type": "application/json"},
+        )
+        if created.status != 200:
+            raise RuntimeError(
+                f"Batch creation failed (HTTP {created.status}): "
+                f"{created.data.decode('utf-8', errors='ignore')[:200]}"
+            )
+        return _json_loads(created.data)["id"]
+
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Return the current Batch API status object for a batch id."""
+        api_base = self._require_batch_api()
+        resp = get_pool().request(
+            "GET",
+            f"{api_base}/batches/{batch_id}",
+            headers={"Authorization": f"Bearer {self.get_api_key()}"},
+        )
+        if resp.status != 200:
+            raise RuntimeError(
+                f"Batch poll failed (HTTP {resp.status}): "
+                f"{resp.data.decode('utf-8', errors='ignore')[:200]}"
+            )
+        return _json_loads(resp.data)
+
+    def fetch_batch_results(self, batch):
+        """
+        Yield (custom_id, LLMResponse) pairs for a completed batch.
+
+        Accepts either a batch id or the status dict returned by poll_batch;
+        the batch must have an output file (status 'completed').
+        """
+        api_base = self._require_batch_api()
+        if isinstance(batch, str):
+            batch = self.poll_batch(batch)
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            raise ValueError(
+                f"Batch has no output file yet (status: {batch.get('status')})"
+            )
+
+        resp = get_pool().request(
+            "GET",
+            f"{api_base}/files/{output_file_id}/content",
+            headers={"Authorization": f"Bearer {self.get_api_key()}"},
+        )
+        if resp.status != 200:
+            raise RuntimeError(
+                f"Batch result download failed (HTTP {resp.status}): "
+                f"{resp.data.decode('utf-8', errors='ignore')[:200]}"
+            )
+
+        for line in resp.data.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            custom_id = record.get("custom_id")
+            response = record.get("response") or {}
+            status_code = response.get("status_code", 200)
+            body = response.get("body") or {}
+            if record.get("error") or status_code != 200:
+                yield custom_id, LLMResponse(
+                    success=False,
+                    error_info={
+                        "type": "api_error",
+                        "status_code": status_code,
+                        "message": str(record.get("error") or body),
+                    },
+                    raw_provider_response=record,
+                    is_retryable=False,
+                )
+                continue
+            yield custom_id, LLMResponse(
+                success=True,
+                standardized_response=self._standardize_response(body),
+                raw_provider_response=body,
+                is_retryable=False,
+            )
+
     def _handle_error_response(self, response, context) -> LLMResponse:
-        # Support both urllib3 and requests-like responses
-        status_code = getattr(response, "status", None)
-        if status_code is None:
-            status_code = getattr(response, "status_code", None)
-        is_retryable = status_code in [408, 425, 429, 500, 502, 503, 504]
+        # Every call site hands us a urllib3-shaped response (.status plus
+        # buffered .data bytes), so read those directly instead of probing
+        # for requests-style attributes on each error.
+        status_code = response.status
         error_text = None
         error_json = None
-        # Try to obtain text/bytes
-        try:
-            if hasattr(response, "data"):
-                error_text = (
-                    response.data.decode("utf-8", errors="ignore")
-                    if isinstance(response.data, (bytes, bytearray))
-                    else str(response.data)
-                )
-            elif hasattr(response, "text"):
-                error_text = response.text
-        except Exception:
-            error_text = None
+        raw = response.data
 
-        if error_text:
-            try:
-                error_json = json.loads(error_text)
-            except Exception:
-                error_json = None
+        if raw:
+            if len(raw) <= _MAX_ERROR_BODY_BYTES:
+                # Parse the bytes directly; decode for the message text only.
+                try:
+                    error_json = _json_loads(raw)
+                except ValueError:
+                    error_json = None
+                error_text = raw.decode("utf-8", errors="ignore")
+            else:
+                error_text = raw[:_MAX_ERROR_BODY_BYTES].decode(
+                    "utf-8", errors="ignore"
+                )
 
-        error_message = self._extract_error_message(error_json, response)
+        return self._build_error_llm_response(
+            status_code, error_text, error_json, context
+        )
 
+    def _build_error_llm_response(
+        self, status_code, error_text, error_json, context
+    ) -> LLMResponse:
+        """Shared tail of error handling: message extraction plus response build."""
         error_info = {
             "type": "api_error",
             "status_code": status_code,
-            "message": error_message,
+            "message": self._extract_error_message(error_json, status_code, error_text),
             "raw_response": (error_text or ""),
         }
-
         return LLMResponse(
             success=False,
             error_info=error_info,
             raw_provider_response=error_json,
-            is_retryable=is_retryable,
+            is_retryable=status_code in RETRYABLE_STATUS_CODES,
             context=context,
         )
 
-    def _extract_error_message(self, error_json, response) -> str:
+    def _extract_error_message(self, error_json, status_code, error_text) -> str:
         if error_json and "error" in error_json:
             error_obj = error_json["error"]
             if isinstance(error_obj, dict) and "message" in error_obj:
                 return error_obj["message"]
             return str(error_obj)
 
-        status = getattr(response, "status_code", "unknown")
-        text = getattr(response, "text", "")
-        return f"Error (HTTP {status}): {text[:200]}"
+        return f"Error (HTTP {status_code}): {(error_text or '')[:200]}"
 
     def _has_content_filter_error(self, response) -> bool:
-        if "choices" in response and response["choices"]:
-            choice = response["choices"][0]
-            if choice.get("finish_reason") == "content_filter" or "error" in choice:
-                return True
-        return False
+        # Single .get instead of a membership test plus subscript
+        choices = response.get("choices")
+        if not choices:
+            return False
+        choice = choices[0]
+        return choice.get("finish_reason") == "content_filter" or "error" in choice
 
     def _extract_content_filter_error(self, response) -> Dict[str, Any]:
         choice = response["choices"][0]
@@ -376,19 +877,24 @@ class OpenAIStyleProvider(LLMProvider):
         return error_info
 
     def _standardize_response(self, provider_response) -> Dict[str, Any]:
+        # One bound .get plus a single dict literal keeps this to one pass
+        # over the response; choices[0] is subscripted exactly once below.
+        get = provider_response.get
         standardized: Dict[str, Any] = {
-            "id": provider_response.get("id"),
-            "created": provider_response.get("created"),
-            "model": provider_response.get("model"),
+            "id": get("id"),
+            "created": get("created"),
+            "model": get("model"),
             "provider": self._get_provider_name(),
             "content": None,
-            "usage": provider_response.get("usage", {}),
+            "usage": get("usage", {}),
         }
 
-        if "choices" in provider_response and provider_response["choices"]:
-            choice = provider_response["choices"][0]
-            if "message" in choice and "content" in choice["message"]:
-                standardized["content"] = choice["message"].get("content")
+        choices = get("choices")
+        if choices:
+            choice = choices[0]
+            message = choice.get("message")
+            if message is not None and "content" in message:
+                standardized["content"] = message.get("content")
             finish_reason = choice.get("finish_reason")
             with_finish_reason_metadata(
                 standardized,
@@ -414,73 +920,83 @@ class OpenAIStyleProvider(LLMProvider):
         Consume an OpenAI-compatible SSE response (requests), aggregate content, and return a final LLMResponse.
         """
         try:
-            aggregated_content: str = ""
+            content_parts: list[str] = []
+            # Pre-bind the hot append; saves a method lookup per SSE event.
+            append_part = content_parts.append
             last_event: Optional[Dict[str, Any]] = None
             finish_reason: Optional[str] = None
             model: Optional[str] = None
             resp_id: Optional[str] = None
             created: Optional[int] = None
+            provider_name = self._get_provider_name()
 
-            for raw_line in response.iter_lines(decode_unicode=True):
-                if not raw_line:
+            # Frame on raw bytes rather than iter_lines(decode_unicode=True):
+            # only the JSON payload of data: lines is ever decoded (by the
+            # parser), and keepalives/comments never become str objects.
+            done = False
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                if done or not chunk:
                     continue
-                line = raw_line.strip()
-                if line.startswith("data:"):
-                    line = line[len("data:") :].strip()
-                if line == "[DONE]":
-                    break
-                # Some servers may send comments or keepalives starting with ':'
-                if line.startswith(":"):
+                buffer += chunk
+                last_newline = buffer.rfind(b"\n")
+                if last_newline < 0:
                     continue
+                complete_lines = bytes(buffer[:last_newline]).split(b"\n")
+                del buffer[: last_newline + 1]
+                for raw_line in complete_lines:
+                    line = raw_line.strip(b"\r")
+                    if not line:
+                        continue
+                    # Some servers send comments or keepalives starting with ':'
+                    name, _, value = line.partition(b":")
+                    if not name:
+                        continue
+                    if name == b"data":
+                        line = value.strip()
+                    if line == b"[DONE]":
+                        done = True
+                        break
 
-                try:
-                    event = json.loads(line)
-                except Exception:
-                    # Skip unparsable chunks; treat as transient noise
-                    continue
+                    try:
+                        event = _json_loads(line)
+                    except ValueError:
+                        # Skip unparsable chunks; treat as transient noise
+                        continue
 
-                last_event = event
-                resp_id = event.get("id", resp_id)
-                created = event.get("created", created)
-                model = event.get("model", model)
+                    last_event = event
+                    resp_id = event.get("id", resp_id)
+                    created = event.get("created", created)
+                    model = event.get("model", model)
 
-                # OpenAI-style streaming puts text deltas under choices[].delta.content
-                try:
-                    choices = event.get("choices") or []
-                    if choices:
-                        choice0 = choices[0]
-                        finish_reason = choice0.get("finish_reason", finish_reason)
-                        delta = choice0.get("delta") or {}
-                        content_piece = delta.get("content")
-                        if content_piece:
-                            aggregated_content += content_piece
-                        # Some providers might stream full messages per chunk
-                        if not content_piece and isinstance(
-                            choice0.get("message"), dict
-                        ):
-                            msg_content = choice0["message"].get("content")
-                            if msg_content:
-                                aggregated_content += msg_content
-                except Exception:
-                    # Continue on minor schema oddities
-                    pass
-
-                # Content filter surfaced mid-stream
-                if self._has_content_filter_error(event):
-                    err = self._extract_content_filter_error(event)
-                    return LLMResponse(
-                        success=False,
-                        error_info=err,
-                        raw_provider_response=event,
-                        is_retryable=False,
-                        context=context,
+                    # OpenAI-style streaming puts text deltas under choices[].delta.content
+                    choice0, content_piece, finish_reason = _extract_delta(
+                        event, finish_reason
                     )
+                    if content_piece:
+                        append_part(content_piece)
+
+                    # Content filter surfaced mid-stream; check the choice we
+                    # already hold instead of re-walking the event
+                    if choice0 is not None and (
+                        choice0.get("finish_reason") == "content_filter"
+                        or "error" in choice0
+                    ):
+                        err = self._extract_content_filter_error(event)
+                        return LLMResponse(
+                            success=False,
+                            error_info=err,
+                            raw_provider_response=event,
+                            is_retryable=False,
+                            context=context,
+                        )
 
+            aggregated_content = "".join(content_parts)
             standardized = {
                 "id": resp_id,
                 "created": created,
                 "model": model,
-                "provider": self._get_provider_name(),
+                "provider": provider_name,
                 "content": aggregated_content,
                 "finish_reason": finish_reason or "stop",
                 "usage": (last_event or {}).get("usage", {}),
@@ -505,71 +1021,99 @@ class OpenAIStyleProvider(LLMProvider):
                 context=context,
             )
         except Exception as e:
-            msg = str(e).lower()
+            msg = str(e)
+            lowered = msg.lower()
             err_type = (
-                "timeout" if "timed out" in msg or "timeout" in msg else "network_error"
+                "timeout"
+                if "timed out" in lowered or "timeout" in lowered
+                else "network_error"
             )
             return LLMResponse(
                 success=False,
                 error_info={
                     "type": err_type,
-                    "message": str(e),
-                    "exception": str(e),
+                    "message": msg,
+                    "exception": msg,
                 },
                 is_retryable=True,
                 context=context,
             )
 
     def _consume_streaming_response_urllib3(self, u3_response, context) -> LLMResponse:
+        """Drain the SSE event generator and return only the final LLMResponse."""
+        final = None
+        for item in self._iter_streaming_events_urllib3(u3_response, context):
+            if isinstance(item, LLMResponse):
+                final = item
+        return final
+
+    def _iter_streaming_events_urllib3(self, u3_response, context):
         """
-        Consume SSE stream using urllib3 HTTPResponse, aggregate content, and return final LLMResponse.
-        Enforces overall timeout via urllib3's total timeout.
+        Consume an SSE stream from a urllib3 HTTPResponse.
+
+        Yields each content fragment (str) as its event is parsed, then yields
+        exactly one final LLMResponse aggregating the whole stream. Enforces
+        the overall timeout via urllib3's total timeout.
         """
         try:
-            aggregated_content: str = ""
+            content_parts: list[str] = []
+            # Pre-bind the hot append; saves a method lookup per SSE event.
+            append_part = content_parts.append
             last_event: Optional[Dict[str, Any]] = None
             finish_reason: Optional[str] = None
             model: Optional[str] = None
             resp_id: Optional[str] = None
             created: Optional[int] = None
+            provider_name = self._get_provider_name()
 
-            buffer = ""
+            # Frame on raw bytes: appending to a bytearray and deleting the
+            # consumed prefix avoids rebuilding an ever-growing str buffer,
+            # and only the JSON payload slice is ever decoded (by the parser).
+            buffer = bytearray()
             for chunk in u3_response.stream(amt=65536, decode_content=True):
                 if not chunk:
                     continue
                 if isinstance(chunk, bytes):
-                    text = chunk.decode("utf-8", errors="ignore")
+                    buffer += chunk
                 else:
-                    text = str(chunk)
-                buffer += text
+                    buffer += str(chunk).encode("utf-8")
 
-                while True:
-                    if "\n" not in buffer:
-                        break
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip("\r")
+                # One scan per chunk: split everything up to the last complete
+                # line at once rather than re-scanning the buffer per line
+                last_newline = buffer.rfind(b"\n")
+                if last_newline < 0:
+                    continue
+                complete_lines = bytes(buffer[:last_newline]).split(b"\n")
+                del buffer[: last_newline + 1]
+                for raw_line in complete_lines:
+                    line = raw_line.strip(b"\r")
                     if not line:
                         continue
-                    if line.startswith(":"):
+                    # One C-level scan splits field name and value; comment
+                    # and keepalive lines surface as an empty name.
+                    name, _, value = line.partition(b":")
+                    if not name:
                         continue
-                    if line.startswith("data:"):
-                        payload = line[len("data:") :].strip()
+                    if name == b"data":
+                        payload = value.strip()
                     else:
+                        # Not a field we consume; may be a bare JSON line.
                         payload = line
-                    if payload == "[DONE]":
+                    if payload == b"[DONE]":
                         # Finish cleanly
                         u3_response.close()
+                        aggregated_content = "".join(content_parts)
                         standardized = {
                             "id": resp_id,
                             "created": created,
                             "model": model,
-                            "provider": self._get_provider_name(),
+                            "provider": provider_name,
                             "content": aggregated_content,
                             "finish_reason": finish_reason or "stop",
                             "usage": (last_event or {}).get("usage", {}),
                         }
                         if (aggregated_content or "").strip() == "":
-                            return LLMResponse(
+                            yield LLMResponse(
                                 success=False,
                                 error_info={
                                     "type": "content_filter",
@@ -579,17 +1123,19 @@ class OpenAIStyleProvider(LLMProvider):
                                 is_retryable=False,
                                 context=context,
                             )
-                        return LLMResponse(
+                            return
+                        yield LLMResponse(
                             success=True,
                             standardized_response=standardized,
                             raw_provider_response=last_event,
                             is_retryable=False,
                             context=context,
                         )
+                        return
 
                     # Parse JSON event
                     try:
-                        event = json.loads(payload)
+                        event = _json_loads(payload)
                     except Exception:
                         continue
                     last_event = event
@@ -604,56 +1150,52 @@ class OpenAIStyleProvider(LLMProvider):
                         else:
                             msg = str(err_obj)
                         u3_response.close()
-                        return LLMResponse(
+                        yield LLMResponse(
                             success=False,
                             error_info={"type": "api_error", "message": msg},
                             raw_provider_response=event,
                             is_retryable=False,
                             context=context,
                         )
+                        return
 
-                    try:
-                        choices = event.get("choices") or []
-                        if choices:
-                            choice0 = choices[0]
-                            finish_reason = choice0.get("finish_reason", finish_reason)
-                            delta = choice0.get("delta") or {}
-                            content_piece = delta.get("content")
-                            if content_piece:
-                                aggregated_content += content_piece
-                            if not content_piece and isinstance(
-                                choice0.get("message"), dict
-                            ):
-                                msg_content = choice0["message"].get("content")
-                                if msg_content:
-                                    aggregated_content += msg_content
-                    except Exception:
-                        pass
+                    choice0, content_piece, finish_reason = _extract_delta(
+                        event, finish_reason
+                    )
+                    if content_piece:
+                        append_part(content_piece)
+                        yield content_piece
 
-                    if self._has_content_filter_error(event):
+                    # Same single-probe filter check on the bound choice
+                    if choice0 is not None and (
+                        choice0.get("finish_reason") == "content_filter"
+                        or "error" in choice0
+                    ):
                         err = self._extract_content_filter_error(event)
                         u3_response.close()
-                        return LLMResponse(
+                        yield LLMResponse(
                             success=False,
                             error_info=err,
                             raw_provider_response=event,
                             is_retryable=False,
                             context=context,
                         )
+                        return
 
             # If stream ended without [DONE], return what we have
             u3_response.close()
+            aggregated_content = "".join(content_parts)
             standardized = {
                 "id": resp_id,
                 "created": created,
                 "model": model,
-                "provider": self._get_provider_name(),
+                "provider": provider_name,
                 "content": aggregated_content,
                 "finish_reason": finish_reason or "stop",
                 "usage": (last_event or {}).get("usage", {}),
             }
             if (aggregated_content or "").strip() == "":
-                return LLMResponse(
+                yield LLMResponse(
                     success=False,
                     error_info={
                         "type": "content_filter",
@@ -663,7 +1205,8 @@ class OpenAIStyleProvider(LLMProvider):
                     is_retryable=False,
                     context=context,
                 )
-            return LLMResponse(
+                return
+            yield LLMResponse(
                 success=True,
                 standardized_response=standardized,
                 raw_provider_response=last_event,
@@ -671,34 +1214,16 @@ class OpenAIStyleProvider(LLMProvider):
                 context=context,
             )
         except Exception as e:
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                err_type = "timeout"
-                retryable = True
-            elif is_ssl or is_location:
-                err_type = "network_error"
-                retryable = False
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
             else:
-                err_type = "network_error"
-                retryable = True
-            return LLMResponse(
+                err_type, retryable = "network_error", True
+            msg = str(e)
+            yield LLMResponse(
                 success=False,
-                error_info={"type": err_type, "message": str(e), "exception": str(e)},
+                error_info={"type": err_type, "message": msg, "exception": msg},
                 is_retryable=retryable,
                 context=context,
             )
@@ -2,15 +2,71 @@
 OpenRouter provider implementation for LLM client.
 """
 
+import functools
 import json
 import os
 
-from ..base import LLMResponse, with_finish_reason_metadata
+from urllib3 import exceptions as _u3_exceptions
+from urllib3.util import Timeout as _Timeout
+
+from .._http import get_pool
+from ..base import LLMResponse, RETRYABLE_STATUS_CODES, with_finish_reason_metadata
 from .openai_responses import OpenAIResponsesStyleProvider
 
+try:
+    # Optional fast path: orjson serializes straight to bytes and parses bytes
+    # without an intermediate str, which matters on the per-event stream path.
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
 # API Endpoint Constants
 OPENROUTER_API_BASE = "https://openrouter.ai/api/v1"
 
+# SSE framing constants, kept as bytes so the stream loop never decodes
+# anything but JSON payloads.
+_DATA_PREFIX = b"data:"
+_DONE = b"[DONE]"
+
+# urllib3 exception groupings for error classification, resolved at import
+_TIMEOUT_EXCEPTIONS = (
+    _u3_exceptions.TimeoutError,
+    _u3_exceptions.ReadTimeoutError,
+    _u3_exceptions.ConnectTimeoutError,
+)
+_FATAL_NETWORK_EXCEPTIONS = (
+    _u3_exceptions.SSLError,
+    _u3_exceptions.LocationParseError,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_routing(only, allow_list, ignore_list):
+    """Build provider-routing items for one (only, allow_list, ignore_list) config.
+
+    Routing is static per caller in most deployments, so the result is
+    memoized on the tuple key; callers rebuild the outer dict per request.
+    The inner lists stay lists (orjson rejects tuples) and are treated as
+    read-only downstream.
+    """
+    routing = {}
+    if only:
+        routing["order"] = list(only)
+        routing["allow_fallbacks"] = False
+    elif allow_list:
+        routing["order"] = list(allow_list)
+        routing["allow_fallbacks"] = False
+    if ignore_list:
+        routing["ignore"] = list(ignore_list)
+    return tuple(routing.items())
+
 
 class OpenRouterProvider(OpenAIResponsesStyleProvider):
     """Provider implementation for OpenRouter API"""
@@ -135,32 +191,42 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
         return self._build_headers()
 
     def _build_headers(self):
-        return {
-            "Authorization": f"Bearer {self.get_api_key()}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": os.getenv(
-                "OPENROUTER_REFERRER", "https://SpeechMap.ai"
-            ),
-            "X-Title": os.getenv("OPENROUTER_TITLE", "SpeechMap.ai"),
-        }
+        # Built once per API key: the referrer/title env vars do not change
+        # mid-process, and key rotation is caught by the identity check.
+        key = self.get_api_key()
+        if self._cached_headers is None or self._cached_headers_key is not key:
+            self._cached_headers = {
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip",
+                "HTTP-Referer": os.getenv(
+                    "OPENROUTER_REFERRER", "https://SpeechMap.ai"
+                ),
+                "X-Title": os.getenv("OPENROUTER_TITLE", "SpeechMap.ai"),
+            }
+            self._cached_headers_key = key
+            self._cached_stream_headers = None
+        return self._cached_headers
+
+    def _build_stream_headers(self):
+        # Streaming variant of the cached headers, also built once per key.
+        if self._cached_stream_headers is None:
+            self._cached_stream_headers = {
+                **self._build_headers(),
+                "Accept": "text/event-stream",
+            }
+        return self._cached_stream_headers
 
     def _provider_routing_from_options(self, options):
-        provider_routing = {}
         only = options.pop("only", None)
         allow_list = options.pop("allow_list", None)
         ignore_list = options.pop("ignore_list", None)
-
-        if only:
-            provider_routing["order"] = list(only)
-            provider_routing["allow_fallbacks"] = False
-        elif allow_list:
-            provider_routing["order"] = list(allow_list)
-            provider_routing["allow_fallbacks"] = False
-
-        if ignore_list:
-            provider_routing["ignore"] = list(ignore_list)
-
-        return provider_routing
+        routing = _build_routing(
+            tuple(only) if only else (),
+            tuple(allow_list) if allow_list else (),
+            tuple(ignore_list) if ignore_list else (),
+        )
+        return dict(routing)
 
     def _make_chat_completion_request(self, messages, model_id, context=None, **options):
         """
@@ -177,14 +243,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
         """
         try:
             url = f"{OPENROUTER_API_BASE}/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.get_api_key()}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": os.getenv(
-                    "OPENROUTER_REFERRER", "https://SpeechMap.ai"
-                ),
-                "X-Title": os.getenv("OPENROUTER_TITLE", "SpeechMap.ai"),
-            }
+            headers = self._build_headers()
 
             timeout = options.pop("timeout", 60)
             transport = options.pop("transport", None)
@@ -208,43 +267,27 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
             }
 
             # Provider routing controls
-            provider_routing = {}
-            only = options.pop("only", None)
-            allow_list = options.pop("allow_list", None)
-            ignore_list = options.pop("ignore_list", None)
-
-            if only:
-                provider_routing["order"] = list(only)
-                provider_routing["allow_fallbacks"] = False
-            elif allow_list:
-                provider_routing["order"] = list(allow_list)
-                provider_routing["allow_fallbacks"] = False
-
-            if ignore_list:
-                provider_routing["ignore"] = list(ignore_list)
-
+            provider_routing = self._provider_routing_from_options(options)
             if provider_routing:
                 data["provider"] = provider_routing
 
             # Remaining options passthrough
-            data.update(options)
+            if options:
+                data.update(options)
 
             # Ensure provider gets stream=True if we are using streaming transport
             if use_stream_transport:
                 data["stream"] = True
 
             # For streaming, request SSE and stream the HTTP response
-            req_headers = dict(headers)
-            if use_stream_transport:
-                req_headers["Accept"] = "text/event-stream"
+            req_headers = (
+                self._build_stream_headers() if use_stream_transport else headers
+            )
 
             if use_stream_transport:
                 # Use urllib3 to enforce an overall timeout for the full streamed request
-                import urllib3
-                from urllib3.util import Timeout as _Timeout
-
-                http = urllib3.PoolManager()
-                body_bytes = json.dumps(data).encode("utf-8")
+                http = get_pool()
+                body_bytes = _json_dumps(data)
                 total_timeout = None
                 if isinstance(timeout, tuple) and len(timeout) == 2:
                     total_timeout = float(timeout[0]) + float(timeout[1])
@@ -281,19 +324,15 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                         success=False,
                         error_info=error_info,
                         raw_provider_response=None,
-                        is_retryable=u3_resp.status
-                        in [408, 425, 429, 500, 502, 503, 504],
+                        is_retryable=u3_resp.status in RETRYABLE_STATUS_CODES,
                         context=context,
                     )
 
                 return self._consume_streaming_response_urllib3(u3_resp, context)
 
             # Non-streaming path: urllib3
-            import urllib3
-            from urllib3.util import Timeout as _Timeout
-
-            http = urllib3.PoolManager()
-            body_bytes = json.dumps(data).encode("utf-8")
+            http = get_pool()
+            body_bytes = _json_dumps(data)
             u3_timeout = (
                 _Timeout(total=float(timeout))
                 if isinstance(timeout, (int, float))
@@ -312,19 +351,20 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 return self._handle_error_response(u3_resp, context)
 
             try:
-                raw_response = json.loads(u3_resp.data.decode("utf-8", errors="ignore"))
+                raw_response = _json_loads(u3_resp.data)
             except Exception:
                 raw_response = {}
             if isinstance(raw_response, dict) and "error" in raw_response:
                 error_message = self._extract_error_message(raw_response, "")
+                raw_bytes = u3_resp.data
                 return LLMResponse(
                     success=False,
                     error_info={
                         "type": "api_error",
-                        "status_code": getattr(u3_resp, "status", None),
+                        "status_code": u3_resp.status,
                         "message": error_message,
-                        "raw_response": u3_resp.data.decode("utf-8", errors="ignore")
-                        if getattr(u3_resp, "data", None)
+                        "raw_response": raw_bytes.decode("utf-8", errors="ignore")
+                        if raw_bytes
                         else "",
                     },
                     raw_provider_response=raw_response,
@@ -333,8 +373,8 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 )
             standardized_response = self._standardize_response(raw_response)
 
-            if self._has_content_filter_error(raw_response):
-                error_info = self._extract_content_filter_error(raw_response)
+            error_info = self._check_content_filter(raw_response)
+            if error_info is not None:
                 return LLMResponse(
                     success=False,
                     error_info=error_info,
@@ -365,52 +405,17 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
             )
 
         except Exception as e:
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "timeout",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=True,
-                    context=context,
-                )
-            if is_ssl or is_location:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "network_error",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=False,
-                    context=context,
-                )
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
+            else:
+                err_type, retryable = "network_error", True
+            msg = str(e)
             return LLMResponse(
                 success=False,
-                error_info={
-                    "type": "network_error",
-                    "message": str(e),
-                    "exception": str(e),
-                },
-                is_retryable=True,
+                error_info={"type": err_type, "message": msg, "exception": msg},
+                is_retryable=retryable,
                 context=context,
             )
 
@@ -458,13 +463,11 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
             if provider_routing:
                 data["provider"] = provider_routing
 
-            data.update(options)
+            if options:
+                data.update(options)
 
-            import urllib3
-            from urllib3.util import Timeout as _Timeout
-
-            http = urllib3.PoolManager()
-            body_bytes = json.dumps(data).encode("utf-8")
+            http = get_pool()
+            body_bytes = _json_dumps(data)
             u3_timeout = (
                 _Timeout(total=float(timeout))
                 if isinstance(timeout, (int, float))
@@ -483,20 +486,21 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 return self._handle_error_response(u3_resp, context)
 
             try:
-                raw_response = json.loads(u3_resp.data.decode("utf-8", errors="ignore"))
+                raw_response = _json_loads(u3_resp.data)
             except Exception:
                 raw_response = {}
 
             if isinstance(raw_response, dict) and "error" in raw_response:
                 error_message = self._extract_error_message(raw_response, "")
+                raw_bytes = u3_resp.data
                 return LLMResponse(
                     success=False,
                     error_info={
                         "type": "api_error",
-                        "status_code": getattr(u3_resp, "status", None),
+                        "status_code": u3_resp.status,
                         "message": error_message,
-                        "raw_response": u3_resp.data.decode("utf-8", errors="ignore")
-                        if getattr(u3_resp, "data", None)
+                        "raw_response": raw_bytes.decode("utf-8", errors="ignore")
+                        if raw_bytes
                         else "",
                     },
                     raw_provider_response=raw_response,
@@ -528,52 +532,17 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 context=context,
             )
         except Exception as e:
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "timeout",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=True,
-                    context=context,
-                )
-            if is_ssl or is_location:
-                return LLMResponse(
-                    success=False,
-                    error_info={
-                        "type": "network_error",
-                        "message": str(e),
-                        "exception": str(e),
-                    },
-                    is_retryable=False,
-                    context=context,
-                )
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
+            else:
+                err_type, retryable = "network_error", True
+            msg = str(e)
             return LLMResponse(
                 success=False,
-                error_info={
-                    "type": "network_error",
-                    "message": str(e),
-                    "exception": str(e),
-                },
-                is_retryable=True,
+                error_info={"type": err_type, "message": msg, "exception": msg},
+                is_retryable=retryable,
                 context=context,
             )
 
@@ -623,9 +592,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
     def _consume_streaming_response(self, response, context):
         """Consume OpenRouter SSE stream (requests) and build final response."""
         try:
-            import json as _json
-
-            aggregated = ""
+            content_parts = []
             last_event = None
             finish_reason = None
             model = None
@@ -643,33 +610,34 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 if line.startswith(":"):
                     continue
                 try:
-                    evt = _json.loads(line)
+                    evt = _json_loads(line)
                 except Exception:
                     continue
 
+                if not isinstance(evt, dict):
+                    continue
                 last_event = evt
-                resp_id = evt.get("id", resp_id)
-                created = evt.get("created", created)
-                model = evt.get("model", model)
+                _get = evt.get
+                resp_id = _get("id", resp_id)
+                created = _get("created", created)
+                model = _get("model", model)
 
                 try:
-                    choices = evt.get("choices") or []
-                    if choices:
-                        c0 = choices[0]
-                        finish_reason = c0.get("finish_reason", finish_reason)
-                        delta = c0.get("delta") or {}
-                        piece = delta.get("content")
-                        if piece:
-                            aggregated += piece
-                        if not piece and isinstance(c0.get("message"), dict):
-                            msg_piece = c0["message"].get("content")
-                            if msg_piece:
-                                aggregated += msg_piece
-                except Exception:
+                    c0 = evt["choices"][0]
+                    finish_reason = c0.get("finish_reason", finish_reason)
+                    delta = c0.get("delta") or {}
+                    piece = delta.get("content")
+                    if piece:
+                        content_parts.append(piece)
+                    elif isinstance(c0.get("message"), dict):
+                        msg_piece = c0["message"].get("content")
+                        if msg_piece:
+                            content_parts.append(msg_piece)
+                except (KeyError, IndexError, TypeError, AttributeError):
                     pass
 
-                if self._has_content_filter_error(evt):
-                    err = self._extract_content_filter_error(evt)
+                err = self._check_content_filter(evt)
+                if err is not None:
                     return LLMResponse(
                         success=False,
                         error_info=err,
@@ -678,6 +646,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                         context=context,
                     )
 
+            aggregated = "".join(content_parts)
             standardized = {
                 "id": resp_id,
                 "created": created,
@@ -724,40 +693,43 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
     def _consume_streaming_response_urllib3(self, u3_response, context):
         """Consume OpenRouter SSE stream via urllib3 and build final response."""
         try:
-            import json as _json
-
-            aggregated = ""
+            content_parts = []
             last_event = None
             finish_reason = None
             model = None
             resp_id = None
             created = None
 
-            buffer = ""
+            # Frame on raw bytes: one rfind scan per network chunk and a
+            # single prefix delete, so the buffer never becomes a str and
+            # only data: payloads ever reach the JSON decoder.
+            buffer = bytearray()
             for chunk in u3_response.stream(amt=65536, decode_content=True):
                 if not chunk:
                     continue
                 if isinstance(chunk, bytes):
-                    text = chunk.decode("utf-8", errors="ignore")
+                    buffer += chunk
                 else:
-                    text = str(chunk)
-                buffer += text
-
-                while True:
-                    if "\n" not in buffer:
-                        break
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip("\r")
+                    buffer += str(chunk).encode("utf-8")
+
+                last_newline = buffer.rfind(b"\n")
+                if last_newline < 0:
+                    continue
+                complete_lines = bytes(buffer[:last_newline]).split(b"\n")
+                del buffer[: last_newline + 1]
+                for raw_line in complete_lines:
+                    line = raw_line.strip(b"\r")
                     if not line:
                         continue
-                    if line.startswith(":"):
+                    if line[:1] == b":":
                         continue
-                    if line.startswith("data:"):
-                        payload = line[len("data:") :].strip()
+                    if line[:5] == _DATA_PREFIX:
+                        payload = line[5:].strip()
                     else:
                         payload = line
-                    if payload == "[DONE]":
+                    if payload == _DONE:
                         u3_response.close()
+                        aggregated = "".join(content_parts)
                         standardized = {
                             "id": resp_id,
                             "created": created,
@@ -787,15 +759,19 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                         )
 
                     try:
-                        evt = _json.loads(payload)
+                        evt = _json_loads(payload)
                     except Exception:
                         continue
 
+                    if not isinstance(evt, dict):
+                        continue
                     last_event = evt
-                    resp_id = evt.get("id", resp_id)
-                    created = evt.get("created", created)
-                    model = evt.get("model", model)
-                    if isinstance(evt, dict) and "error" in evt:
+                    # One bound .get serves the per-event metadata reads
+                    _get = evt.get
+                    resp_id = _get("id", resp_id)
+                    created = _get("created", created)
+                    model = _get("model", model)
+                    if "error" in evt:
                         err = evt.get("error")
                         if isinstance(err, dict):
                             msg = err.get("message") or str(err)
@@ -809,24 +785,24 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                             is_retryable=False,
                             context=context,
                         )
+                    # Common case is a well-formed choices[0]; reach for it
+                    # directly and let the handler cover sparse events
                     try:
-                        choices = evt.get("choices") or []
-                        if choices:
-                            c0 = choices[0]
-                            finish_reason = c0.get("finish_reason", finish_reason)
-                            delta = c0.get("delta") or {}
-                            piece = delta.get("content")
-                            if piece:
-                                aggregated += piece
-                            if not piece and isinstance(c0.get("message"), dict):
-                                msg_piece = c0["message"].get("content")
-                                if msg_piece:
-                                    aggregated += msg_piece
-                    except Exception:
+                        c0 = evt["choices"][0]
+                        finish_reason = c0.get("finish_reason", finish_reason)
+                        delta = c0.get("delta") or {}
+                        piece = delta.get("content")
+                        if piece:
+                            content_parts.append(piece)
+                        elif isinstance(c0.get("message"), dict):
+                            msg_piece = c0["message"].get("content")
+                            if msg_piece:
+                                content_parts.append(msg_piece)
+                    except (KeyError, IndexError, TypeError, AttributeError):
                         pass
 
-                    if self._has_content_filter_error(evt):
-                        err = self._extract_content_filter_error(evt)
+                    err = self._check_content_filter(evt)
+                    if err is not None:
                         u3_response.close()
                         return LLMResponse(
                             success=False,
@@ -837,6 +813,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                         )
 
             u3_response.close()
+            aggregated = "".join(content_parts)
             standardized = {
                 "id": resp_id,
                 "created": created,
@@ -865,34 +842,16 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 context=context,
             )
         except Exception as e:
-            try:
-                from urllib3 import exceptions as u3e
-            except Exception:
-                u3e = None
-            is_timeout = u3e and isinstance(
-                e,
-                (
-                    getattr(u3e, "TimeoutError", tuple()),
-                    getattr(u3e, "ReadTimeoutError", tuple()),
-                    getattr(u3e, "ConnectTimeoutError", tuple()),
-                ),
-            )
-            is_ssl = u3e and isinstance(e, getattr(u3e, "SSLError", tuple()))
-            is_location = u3e and isinstance(
-                e, getattr(u3e, "LocationParseError", tuple())
-            )
-            if is_timeout:
-                err_type = "timeout"
-                retryable = True
-            elif is_ssl or is_location:
-                err_type = "network_error"
-                retryable = False
+            if isinstance(e, _TIMEOUT_EXCEPTIONS):
+                err_type, retryable = "timeout", True
+            elif isinstance(e, _FATAL_NETWORK_EXCEPTIONS):
+                err_type, retryable = "network_error", False
             else:
-                err_type = "network_error"
-                retryable = True
+                err_type, retryable = "network_error", True
+            msg = str(e)
             return LLMResponse(
                 success=False,
-                error_info={"type": err_type, "message": str(e), "exception": str(e)},
+                error_info={"type": err_type, "message": msg, "exception": msg},
                 is_retryable=retryable,
                 context=context,
             )
@@ -902,7 +861,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
         status_code = getattr(response, "status", None)
         if status_code is None:
             status_code = getattr(response, "status_code", None)
-        is_retryable = status_code in [408, 425, 429, 500, 502, 503, 504]
+        is_retryable = status_code in RETRYABLE_STATUS_CODES
 
         error_text = None
         error_json = None
@@ -920,7 +879,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
 
         if error_text:
             try:
-                error_json = json.loads(error_text)
+                error_json = _json_loads(error_text)
             except Exception:
                 error_json = None
 
@@ -952,15 +911,32 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
 
     def _has_content_filter_error(self, response):
         """Check if the response contains a content filter error"""
-        if "choices" in response and len(response["choices"]) > 0:
-            choice = response["choices"][0]
-            if choice.get("finish_reason") == "content_filter" or "error" in choice:
-                return True
-        return False
+        choices = response.get("choices")
+        if not choices:
+            return False
+        choice = choices[0]
+        return choice.get("finish_reason") == "content_filter" or "error" in choice
+
+    def _check_content_filter(self, response):
+        """Detect and extract a content-filter error in a single walk.
+
+        Returns the error_info dict when choices[0] was filtered, else None;
+        fuses _has_content_filter_error + _extract_content_filter_error so
+        per-event callers index choices[0] exactly once.
+        """
+        choices = response.get("choices")
+        if not choices:
+            return None
+        choice = choices[0]
+        if choice.get("finish_reason") != "content_filter" and "error" not in choice:
+            return None
+        return self._content_filter_error_from_choice(choice)
 
     def _extract_content_filter_error(self, response):
         """Extract content filter error from response"""
-        choice = response["choices"][0]
+        return self._content_filter_error_from_choice(response["choices"][0])
+
+    def _content_filter_error_from_choice(self, choice):
         finish_reason = choice.get("finish_reason")
         native_finish_reason = choice.get("native_finish_reason")
         if "error" in choice:
@@ -1069,22 +1045,26 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
 
     def _standardize_response(self, provider_response):
         """Convert OpenRouter response to standardized format"""
+        get = provider_response.get
         standardized = {
-            "id": provider_response.get("id"),
-            "created": provider_response.get("created"),
-            "model": provider_response.get("model"),
+            "id": get("id"),
+            "created": get("created"),
+            "model": get("model"),
             "provider": "openrouter",
             "content": None,
-            "usage": provider_response.get("usage", {}),
+            "usage": get("usage", {}),
         }
 
-        if "_provider_used" in provider_response:
-            standardized["sub_provider"] = provider_response["_provider_used"]
+        sub_provider = get("_provider_used")
+        if sub_provider is not None:
+            standardized["sub_provider"] = sub_provider
 
-        if "choices" in provider_response and len(provider_response["choices"]) > 0:
-            choice = provider_response["choices"][0]
-            if "message" in choice and "content" in choice["message"]:
-                standardized["content"] = choice["message"].get("content")
+        choices = get("choices")
+        if choices:
+            choice = choices[0]
+            message = choice.get("message")
+            if message is not None and "content" in message:
+                standardized["content"] = message.get("content")
             finish_reason = choice.get("finish_reason")
             with_finish_reason_metadata(
                 standardized,
@@ -1110,12 +1090,9 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
         Get list of providers available for the given model ID
         """
         try:
-            import urllib3
-            from urllib3.util import Timeout as _Timeout
-
             endpoints_url = f"{OPENROUTER_API_BASE}/models/{model_id}/endpoints"
             headers = {"Authorization": f"Bearer {self.get_api_key()}"}
-            http = urllib3.PoolManager()
+            http = get_pool()
             resp = http.request(
                 "GET",
                 endpoints_url,
@@ -1129,7 +1106,7 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 )
                 return None
             try:
-                data = json.loads(resp.data.decode("utf-8", errors="ignore"))
+                data = _json_loads(resp.data)
             except Exception as e:
                 print(
                     f"ERROR: Failed to parse OpenRouter providers JSON for {model_id}: {e}"
@@ -1137,26 +1114,22 @@ class OpenRouterProvider(OpenAIResponsesStyleProvider):
                 return None
 
             if "data" in data and isinstance(data["data"], list):
-                providers = [
-                    ep.get("provider_name")
-                    for ep in data["data"]
-                    if ep.get("provider_name")
-                ]
-                unique_providers = sorted(list(set(p for p in providers if p)))
-                return unique_providers
+                return sorted(
+                    {name for ep in data["data"] if (name := ep.get("provider_name"))}
+                )
 
             elif (
                 "data" in data
                 and "endpoints" in data["data"]
                 and isinstance(data["data"]["endpoints"], list)
             ):
-                providers = [
-                    ep.get("provider_name")
-                    for ep in data["data"]["endpoints"]
-                    if ep.get("provider_name")
-                ]
-                unique_providers = sorted(list(set(p for p in providers if p)))
-                return unique_providers
+                return sorted(
+                    {
+                        name
+                        for ep in data["data"]["endpoints"]
+                        if (name := ep.get("provider_name"))
+                    }
+                )
 
             else:
                 print(
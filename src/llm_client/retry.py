@@ -1,10 +1,58 @@
 """Retry logic for LLM API requests."""
 
+import functools
 import logging
 import random
 import threading
 import time
 
+from .cache import get_default_cache, is_cacheable_request, make_cache_key
+
+# Cap on any single backoff delay, in seconds.
+_MAX_BACKOFF = 60
+
+
+@functools.lru_cache(maxsize=32)
+def _backoff_schedule(initial_delay, backoff_factor, attempts):
+    """
+    Return the capped exponential backoff delays for a retry configuration.
+
+    Computed once per (initial_delay, backoff_factor, attempts) tuple and
+    cached, so the retry loop just indexes a tuple instead of redoing the
+    exponentiation on every attempt. Jitter stays per-attempt in the caller.
+    """
+    return tuple(
+        min(initial_delay * (backoff_factor**i), _MAX_BACKOFF)
+        for i in range(attempts)
+    )
+
+
+def _canonicalize_messages(messages):
+    """
+    Rebuild message dicts with a deterministic key order.
+
+    Providers serialize payloads in dict insertion order, so emitting "role"
+    then "content" first (and any remaining keys sorted) makes semantically
+    identical prompts byte-identical on the wire, which maximizes upstream
+    prompt-cache hits. Message order and content are never altered.
+    """
+    canonical = []
+    for message in messages:
+        if not isinstance(message, dict):
+            # Unexpected shape; leave the payload untouched for the provider
+            # to validate.
+            return messages
+        ordered = {}
+        if "role" in message:
+            ordered["role"] = message["role"]
+        if "content" in message:
+            ordered["content"] = message["content"]
+        for key in sorted(message):
+            if key not in ordered:
+                ordered[key] = message[key]
+        canonical.append(ordered)
+    return canonical
+
 
 def retry_request(
     provider,
@@ -18,6 +66,8 @@ def retry_request(
     verbose=False,
     logger=None,
     request_format="chat_completions",
+    use_cache=False,
+    cache=None,
     **options,
 ):
     """
@@ -35,13 +85,37 @@ def retry_request(
         verbose: When True, emit retry progress messages via the provided logger
         logger: Optional ``logging.Logger`` instance to use when ``verbose`` is True
         request_format: Provider request format to use
+        use_cache: When True, serve deterministic repeat requests from an
+            in-memory cache instead of re-hitting the API
+        cache: Optional ResponseCache instance; defaults to the shared cache
         **options: Additional provider-specific options
 
     Returns:
         Final LLMResponse object (either successful or last failed attempt)
     """
+    if isinstance(messages, list):
+        messages = _canonicalize_messages(messages)
+
+    cache_key = None
+    response_cache = None
+    if use_cache and is_cacheable_request(options):
+        response_cache = cache if cache is not None else get_default_cache()
+        provider_name = (
+            getattr(provider, "provider_name", None) or type(provider).__name__
+        )
+        cache_key = make_cache_key(
+            provider_name,
+            model_id,
+            messages,
+            {**options, "request_format": request_format},
+        )
+        cached = response_cache.get(cache_key, context=context)
+        if cached is not None:
+            return cached
+
     retries = 0
     last_response = None
+    delays = _backoff_schedule(initial_delay, backoff_factor, max_retries)
     log = logger or logging.getLogger(__name__)
 
     def _log(message):
@@ -69,15 +143,16 @@ def retry_request(
                 response.request_format = request_format
 
         if response.success or not response.is_retryable:
+            if cache_key is not None and response.success:
+                response_cache.put(cache_key, response)
             return response
 
         last_response = response
         retries += 1
 
         if retries <= max_retries:
-            # Calculate backoff with jitter
-            delay = min(initial_delay * (backoff_factor ** (retries - 1)), 60)
-            actual_delay = delay * (1 + random.uniform(-jitter, jitter))
+            # Look up precomputed backoff and apply per-attempt jitter
+            actual_delay = delays[retries - 1] * (1 + random.uniform(-jitter, jitter))
 
             error_msg = "Unknown error"
             if response.error_info and "message" in response.error_info:
@@ -73,6 +73,10 @@ class CoherencyTester:
         self.verbose = bool(verbose)
         self.print_summary = bool(print_summary)
 
+        # Persistent worker pool, created lazily and reused across run_tests()
+        # calls so repeated runs don't pay thread spawn/teardown costs.
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
         # Determine if reasoning expectation should be enforced
         reasoning_cfg = (
             self.request_overrides.get("reasoning")
@@ -140,6 +144,28 @@ class CoherencyTester:
                         file=sys.stderr,
                     )
 
+    # --------------------------- Worker pool ---------------------------
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the persistent worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.num_workers, thread_name_prefix="coh"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the persistent worker pool (safe to call repeatedly)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     # --------------------------- Judge helpers ---------------------------
 
     def create_judge_prompt(self, request: str, response: str) -> str:
@@ -453,71 +479,69 @@ Answer ONLY with 'YES' or 'NO'. Do not provide any explanation.
                 future = executor.submit(self.test_model, test_prompt, provider_filter)
                 in_flight[future] = (provider, test_prompt["id"])
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.num_workers
-        ) as executor:
-            schedule_up_to_capacity(executor)
-
-            while in_flight:
-                # as_completed yields as futures complete; we reschedule as we go
-                for future in concurrent.futures.as_completed(list(in_flight.keys())):
-                    provider, test_id = in_flight.pop(future)
-                    try:
-                        result = future.result()
-                    except Exception as e:
-                        # Treat unexpected exceptions as a failure for this provider
-                        result = {
-                            "test_id": test_id,
-                            "success": False,
-                            "error": f"Exception: {str(e)}",
-                            "exception": str(e),
-                            "provider_filter": [provider]
-                            if provider is not None
-                            else None,
-                        }
-
-                    provider_state[provider]["results"].append(result)
-
-                    if not result.get("success", False):
-                        provider_state[provider]["failed"] = True
-                        if not provider_state[provider].get("failed_category"):
-                            provider_state[provider]["failed_category"] = result.get(
-                                "failure_category", "unknown"
-                            )
-                        if (
-                            is_openrouter
-                            and provider is not None
-                            and self.print_summary
-                        ):
-                            print(
-                                f"    [FAIL] Test '{test_id}' failed for provider [{provider}]",
-                                file=sys.stderr,
-                            )
-                        elif self.print_summary:
-                            print(f"  [FAIL] Test '{test_id}' failed", file=sys.stderr)
-                        # Verbose dump of the raw provider response
-                        if self.verbose:
-                            raw = result.get("response")
-                            print("    --- Raw provider response begin ---")
+        executor = self._get_executor()
+        schedule_up_to_capacity(executor)
+
+        while in_flight:
+            # as_completed yields as futures complete; we reschedule as we go
+            for future in concurrent.futures.as_completed(list(in_flight.keys())):
+                provider, test_id = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Treat unexpected exceptions as a failure for this provider
+                    result = {
+                        "test_id": test_id,
+                        "success": False,
+                        "error": f"Exception: {str(e)}",
+                        "exception": str(e),
+                        "provider_filter": [provider]
+                        if provider is not None
+                        else None,
+                    }
+
+                provider_state[provider]["results"].append(result)
+
+                if not result.get("success", False):
+                    provider_state[provider]["failed"] = True
+                    if not provider_state[provider].get("failed_category"):
+                        provider_state[provider]["failed_category"] = result.get(
+                            "failure_category", "unknown"
+                        )
+                    if (
+                        is_openrouter
+                        and provider is not None
+                        and self.print_summary
+                    ):
+                        print(
+                            f"    [FAIL] Test '{test_id}' failed for provider [{provider}]",
+                            file=sys.stderr,
+                        )
+                    elif self.print_summary:
+                        print(f"  [FAIL] Test '{test_id}' failed", file=sys.stderr)
+                    # Verbose dump of the raw provider response
+                    if self.verbose:
+                        raw = result.get("response")
+                        print("    --- Raw provider response begin ---")
+                        try:
+                            print(json.dumps(raw, indent=2, ensure_ascii=False))
+                        except Exception:
                             try:
-                                print(json.dumps(raw, indent=2, ensure_ascii=False))
+                                print(str(raw))
                             except Exception:
-                                try:
-                                    print(str(raw))
-                                except Exception:
-                                    print(repr(raw))
-                            print("    --- Raw provider response end ---")
-                    else:
-                        if self.print_summary:
-                            if is_openrouter and provider is not None:
-                                print(
-                                    f"    [PASS] Test '{test_id}' passed for provider [{provider}]"
-                                )
-                            else:
-                                print(f"  [PASS] Test '{test_id}' passed")
-
-                    # Keep the pool full
-                    schedule_up_to_capacity(executor)
+                                print(repr(raw))
+                        print("    --- Raw provider response end ---")
+                else:
+                    if self.print_summary:
+                        if is_openrouter and provider is not None:
+                            print(
+                                f"    [PASS] Test '{test_id}' passed for provider [{provider}]"
+                            )
+                        else:
+                            print(f"  [PASS] Test '{test_id}' passed")
+
+                # Keep the pool full
+                schedule_up_to_capacity(executor)
 
         # Summarize results
         if is_openrouter:
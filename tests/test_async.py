@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the async request entry points on LLMProvider.
+"""
+
+import asyncio
+import json
+import os
+import types
+import unittest
+import sys
+from unittest.mock import patch
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from llm_client import LLMResponse, get_provider
+from llm_client.base import LLMProvider
+from llm_client.providers import openai_style
+
+
+class EchoProvider(LLMProvider):
+    """Provider that echoes the last user message back."""
+
+    def _get_api_key_env_var(self):
+        return "MOCK_API_KEY"
+
+    def make_chat_completion_request(self, messages, model_id, context=None, **options):
+        return LLMResponse(
+            success=True,
+            standardized_response={"content": messages[-1]["content"]},
+            context=context,
+        )
+
+
+class FakeAioResponse:
+    """Async context manager standing in for an aiohttp response."""
+
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeAioSession:
+    """Records post calls and serves a canned chat completion."""
+
+    def __init__(self):
+        self.closed = False
+        self.post_calls = []
+
+    async def close(self):
+        self.closed = True
+
+    def post(self, url, **kwargs):
+        self.post_calls.append((url, kwargs))
+        body = json.dumps(
+            {
+                "choices": [
+                    {
+                        "message": {"content": "aio reply"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "model": "gpt-test",
+            }
+        ).encode("utf-8")
+        return FakeAioResponse(200, body)
+
+
+class TestAsyncRequests(unittest.IsolatedAsyncioTestCase):
+    async def test_amake_chat_completion_request(self):
+        provider = EchoProvider()
+        res = await provider.amake_chat_completion_request(
+            messages=[{"role": "user", "content": "hello"}],
+            model_id="m",
+            context={"k": 1},
+        )
+        self.assertTrue(res.success)
+        self.assertEqual(res.standardized_response["content"], "hello")
+        self.assertEqual(res.context, {"k": 1})
+
+    async def test_gather_fans_out_concurrently(self):
+        provider = EchoProvider()
+        prompts = [f"prompt {i}" for i in range(5)]
+        responses = await asyncio.gather(
+            *[
+                provider.amake_chat_completion_request(
+                    messages=[{"role": "user", "content": p}], model_id="m"
+                )
+                for p in prompts
+            ]
+        )
+        self.assertEqual(
+            [r.standardized_response["content"] for r in responses], prompts
+        )
+
+    async def test_native_aiohttp_path_reuses_one_session(self):
+        """The native transport caches one ClientSession per event loop."""
+        fake_session = FakeAioSession()
+        stub_aiohttp = types.SimpleNamespace(
+            ClientTimeout=lambda total=None: total,
+            ClientSession=lambda: fake_session,
+        )
+        with patch.object(openai_style, "aiohttp", stub_aiohttp), patch.dict(
+            os.environ, {"OPENAI_API_KEY": "mock-openai-key"}
+        ):
+            provider = get_provider("openai")
+            first = await provider.amake_chat_completion_request(
+                messages=[{"role": "user", "content": "hello"}],
+                model_id="gpt-test",
+            )
+            second = await provider.amake_chat_completion_request(
+                messages=[{"role": "user", "content": "again"}],
+                model_id="gpt-test",
+            )
+
+        self.assertTrue(first.success)
+        self.assertEqual(first.standardized_response["content"], "aio reply")
+        self.assertTrue(second.success)
+        self.assertEqual(len(fake_session.post_calls), 2)
+        self.assertEqual(list(provider._aio_sessions.values()), [fake_session])
+
+        await provider.aclose()
+        self.assertTrue(fake_session.closed)
+        self.assertEqual(provider._aio_sessions, {})
+
+    async def test_aio_sessions_evict_closed_loops(self):
+        """Sessions keyed by a dead event loop are dropped on the next use."""
+        fake_session = FakeAioSession()
+        stub_aiohttp = types.SimpleNamespace(
+            ClientTimeout=lambda total=None: total,
+            ClientSession=lambda: fake_session,
+        )
+        dead_loop = asyncio.new_event_loop()
+        dead_loop.close()
+        stale_session = FakeAioSession()
+
+        with patch.object(openai_style, "aiohttp", stub_aiohttp), patch.dict(
+            os.environ, {"OPENAI_API_KEY": "mock-openai-key"}
+        ):
+            provider = get_provider("openai")
+            provider._aio_sessions[dead_loop] = stale_session
+            await provider.amake_chat_completion_request(
+                messages=[{"role": "user", "content": "hello"}],
+                model_id="gpt-test",
+            )
+
+        self.assertNotIn(dead_loop, provider._aio_sessions)
+        self.assertEqual(list(provider._aio_sessions.values()), [fake_session])
+
+    async def test_amake_request_sets_request_format(self):
+        provider = EchoProvider()
+        res = await provider.amake_request(
+            messages=[{"role": "user", "content": "hi"}], model_id="m"
+        )
+        self.assertTrue(res.success)
+        self.assertEqual(res.request_format, "chat_completions")
+
+
+if __name__ == "__main__":
+    unittest.main()
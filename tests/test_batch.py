@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the OpenAI Batch API helpers on OpenAIStyleProvider.
+"""
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+import sys
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from llm_client.providers.openai import OpenAIProvider
+from llm_client.providers.fireworks import FireworksProvider
+
+
+class U3Resp:
+    def __init__(self, status, data):
+        self.status = status
+        self.data = json.dumps(data).encode("utf-8") if isinstance(data, dict) else data
+
+
+@patch.dict(os.environ, {"OPENAI_API_KEY": "mock-openai-key"})
+class TestBatchAPI(unittest.TestCase):
+    def test_batch_api_gated_to_openai(self):
+        """Non-OpenAI providers must refuse Batch API calls."""
+        with patch.dict(os.environ, {"FIREWORKS_API_KEY": "mock-key"}):
+            provider = FireworksProvider()
+            with self.assertRaises(ValueError):
+                provider.submit_batch([{"model": "m", "messages": []}])
+            with self.assertRaises(ValueError):
+                provider.poll_batch("batch_123")
+
+    @patch("urllib3.PoolManager.request")
+    def test_submit_batch_uploads_jsonl_and_creates_job(self, mock_request):
+        mock_request.side_effect = [
+            U3Resp(200, {"id": "file_abc"}),
+            U3Resp(200, {"id": "batch_xyz"}),
+        ]
+
+        provider = OpenAIProvider()
+        batch_id = provider.submit_batch(
+            [
+                {
+                    "custom_id": "req-1",
+                    "model": "gpt-4o",
+                    "messages": [{"role": "user", "content": "hi"}],
+                }
+            ]
+        )
+
+        self.assertEqual(batch_id, "batch_xyz")
+        self.assertEqual(mock_request.call_count, 2)
+
+        # First call: multipart upload with purpose=batch and JSONL payload
+        upload_call = mock_request.call_args_list[0]
+        self.assertTrue(upload_call.args[1].endswith("/files"))
+        fields = upload_call.kwargs["fields"]
+        self.assertEqual(fields["purpose"], "batch")
+        filename, payload, content_type = fields["file"]
+        record = json.loads(payload.decode("utf-8"))
+        self.assertEqual(record["custom_id"], "req-1")
+        self.assertEqual(record["url"], "/v1/chat/completions")
+        self.assertEqual(record["body"]["model"], "gpt-4o")
+        self.assertNotIn("custom_id", record["body"])
+
+        # Second call: batch creation referencing the uploaded file
+        create_call = mock_request.call_args_list[1]
+        self.assertTrue(create_call.args[1].endswith("/batches"))
+        created_body = json.loads(create_call.kwargs["body"])
+        self.assertEqual(created_body["input_file_id"], "file_abc")
+        self.assertEqual(created_body["completion_window"], "24h")
+
+    @patch("urllib3.PoolManager.request")
+    def test_poll_batch_returns_status(self, mock_request):
+        mock_request.return_value = U3Resp(
+            200, {"id": "batch_xyz", "status": "in_progress"}
+        )
+        provider = OpenAIProvider()
+        status = provider.poll_batch("batch_xyz")
+        self.assertEqual(status["status"], "in_progress")
+
+    @patch("urllib3.PoolManager.request")
+    def test_fetch_batch_results_yields_llm_responses(self, mock_request):
+        output_lines = [
+            {
+                "custom_id": "req-1",
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "id": "cmpl-1",
+                        "model": "gpt-4o",
+                        "choices": [
+                            {
+                                "message": {"content": "hello"},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                    },
+                },
+            },
+            {
+                "custom_id": "req-2",
+                "response": {"status_code": 429, "body": {}},
+                "error": {"message": "rate limited"},
+            },
+        ]
+        jsonl = "\n".join(json.dumps(line) for line in output_lines).encode("utf-8")
+        mock_request.return_value = U3Resp(200, jsonl)
+
+        provider = OpenAIProvider()
+        results = dict(
+            provider.fetch_batch_results(
+                {"id": "batch_xyz", "status": "completed", "output_file_id": "file_out"}
+            )
+        )
+
+        self.assertTrue(results["req-1"].success)
+        self.assertEqual(results["req-1"].standardized_response["content"], "hello")
+        self.assertFalse(results["req-2"].success)
+        self.assertEqual(results["req-2"].error_info["status_code"], 429)
+
+    def test_fetch_batch_results_requires_output_file(self):
+        provider = OpenAIProvider()
+        with self.assertRaises(ValueError):
+            list(
+                provider.fetch_batch_results(
+                    {"id": "batch_xyz", "status": "in_progress"}
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory response cache and its retry_request integration.
+"""
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+import sys
+
+# Add the parent directory to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from llm_client import retry_request, LLMResponse
+from llm_client.base import LLMProvider
+from llm_client.cache import ResponseCache, is_cacheable_request, make_cache_key
+
+
+class CountingProvider(LLMProvider):
+    """Provider that counts calls and always succeeds."""
+
+    provider_name = "counting"
+
+    def __init__(self):
+        super().__init__()
+        self.call_count = 0
+
+    def _get_api_key_env_var(self):
+        return "MOCK_API_KEY"
+
+    def make_chat_completion_request(self, messages, model_id, context=None, **options):
+        self.call_count += 1
+        return LLMResponse(
+            success=True,
+            standardized_response={"content": f"response {self.call_count}"},
+            context=context,
+        )
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_put_get_roundtrip(self):
+        cache = ResponseCache(maxsize=4, ttl=60)
+        response = LLMResponse(
+            success=True, standardized_response={"content": "hello"}
+        )
+        cache.put("key", response)
+        hit = cache.get("key", context={"c": 1})
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit.standardized_response, {"content": "hello"})
+        self.assertEqual(hit.context, {"c": 1})
+
+    def test_hits_are_isolated_from_caller_mutation(self):
+        """Mutating one hit's payloads must not poison later hits."""
+        cache = ResponseCache(maxsize=4, ttl=60)
+        cache.put(
+            "key",
+            LLMResponse(
+                success=True,
+                standardized_response={"content": "hello"},
+                raw_provider_response={"choices": [{"text": "hello"}]},
+            ),
+        )
+        first = cache.get("key")
+        first.standardized_response["content"] = "mutated"
+        first.raw_provider_response["choices"].clear()
+
+        second = cache.get("key")
+        self.assertEqual(second.standardized_response, {"content": "hello"})
+        self.assertEqual(second.raw_provider_response, {"choices": [{"text": "hello"}]})
+
+    def test_failures_are_not_cached(self):
+        cache = ResponseCache()
+        cache.put("key", LLMResponse(success=False, error_info={"type": "api_error"}))
+        self.assertIsNone(cache.get("key"))
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=-1)
+        cache.put("key", LLMResponse(success=True, standardized_response={}))
+        self.assertIsNone(cache.get("key"))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(maxsize=1, ttl=60)
+        cache.put("a", LLMResponse(success=True, standardized_response={"i": 1}))
+        cache.put("b", LLMResponse(success=True, standardized_response={"i": 2}))
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+
+    def test_cache_key_is_order_insensitive_for_options(self):
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = make_cache_key("p", "m", messages, {"a": 1, "b": 2})
+        key2 = make_cache_key("p", "m", messages, {"b": 2, "a": 1})
+        self.assertEqual(key1, key2)
+
+    def test_is_cacheable_request(self):
+        self.assertTrue(is_cacheable_request({"temperature": 0}))
+        self.assertFalse(is_cacheable_request({}))
+        self.assertFalse(is_cacheable_request({"temperature": 0.7}))
+        self.assertFalse(
+            is_cacheable_request({"temperature": 0, "transport": "stream"})
+        )
+
+
+class TestRetryRequestCaching(unittest.TestCase):
+    def test_cache_hit_skips_network(self):
+        provider = CountingProvider()
+        cache = ResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+
+        first = retry_request(
+            provider, messages, "model", use_cache=True, cache=cache, temperature=0
+        )
+        second = retry_request(
+            provider, messages, "model", use_cache=True, cache=cache, temperature=0
+        )
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertEqual(provider.call_count, 1)
+        self.assertEqual(
+            first.standardized_response, second.standardized_response
+        )
+
+    def test_non_deterministic_requests_bypass_cache(self):
+        provider = CountingProvider()
+        cache = ResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+
+        retry_request(provider, messages, "model", use_cache=True, cache=cache)
+        retry_request(provider, messages, "model", use_cache=True, cache=cache)
+        self.assertEqual(provider.call_count, 2)
+
+    def test_cache_disabled_by_default(self):
+        provider = CountingProvider()
+        messages = [{"role": "user", "content": "hi"}]
+
+        retry_request(provider, messages, "model", temperature=0)
+        retry_request(provider, messages, "model", temperature=0)
+        self.assertEqual(provider.call_count, 2)
+
+
+class TestGoogleProviderCache(unittest.TestCase):
+    @patch.dict(os.environ, {"GEMINI_API_KEY": "mock-gemini-key"})
+    @patch("urllib3.PoolManager.request")
+    def test_google_opt_in_cache_skips_network(self, mock_request):
+        from llm_client.providers import google
+
+        class U3Resp:
+            def __init__(self, status, data):
+                self.status = status
+                self.data = json.dumps(data).encode("utf-8")
+
+        mock_request.return_value = U3Resp(
+            200,
+            {
+                "candidates": [
+                    {
+                        "content": {"parts": [{"text": "cached answer"}]},
+                        "finishReason": "STOP",
+                    }
+                ]
+            },
+        )
+
+        provider = google.GoogleProvider()
+        messages = [{"role": "user", "content": "deterministic question"}]
+        with patch.object(google, "_RESPONSE_CACHE", ResponseCache()):
+            first = provider.make_chat_completion_request(
+                messages, "gemini-1.5-pro", temperature=0, cache=True
+            )
+            second = provider.make_chat_completion_request(
+                messages, "gemini-1.5-pro", temperature=0, cache=True
+            )
+
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(
+            first.standardized_response["content"],
+            second.standardized_response["content"],
+        )
+
+
+class TestOpenAIStyleProviderCache(unittest.TestCase):
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "mock-openai-key"})
+    @patch("urllib3.PoolManager.request")
+    def test_openai_opt_in_cache_skips_network(self, mock_request):
+        from llm_client.providers import openai_style
+        from llm_client.providers.openai import OpenAIProvider
+
+        class U3Resp:
+            def __init__(self, status, data):
+                self.status = status
+                self.data = json.dumps(data).encode("utf-8")
+
+        mock_request.return_value = U3Resp(
+            200,
+            {
+                "id": "cmpl-1",
+                "model": "gpt-4o-2024-08-06",
+                "choices": [
+                    {
+                        "message": {"content": "cached answer"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+        provider = OpenAIProvider()
+        messages = [{"role": "user", "content": "deterministic question"}]
+        with patch.object(openai_style, "_RESPONSE_CACHE", ResponseCache()):
+            first = provider.make_chat_completion_request(
+                messages, "gpt-4o-2024-08-06", temperature=0, cache=True
+            )
+            second = provider.make_chat_completion_request(
+                messages, "gpt-4o-2024-08-06", temperature=0, cache=True
+            )
+
+        self.assertTrue(first.success)
+        self.assertTrue(second.success)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(
+            first.standardized_response["content"],
+            second.standardized_response["content"],
+        )
+
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "mock-openai-key"})
+    @patch("urllib3.PoolManager.request")
+    def test_openai_cache_requires_opt_in(self, mock_request):
+        from llm_client.providers import openai_style
+        from llm_client.providers.openai import OpenAIProvider
+
+        class U3Resp:
+            def __init__(self, status, data):
+                self.status = status
+                self.data = json.dumps(data).encode("utf-8")
+
+        mock_request.return_value = U3Resp(
+            200,
+            {
+                "id": "cmpl-1",
+                "model": "gpt-4o-2024-08-06",
+                "choices": [
+                    {
+                        "message": {"content": "fresh answer"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+        provider = OpenAIProvider()
+        messages = [{"role": "user", "content": "deterministic question"}]
+        with patch.object(openai_style, "_RESPONSE_CACHE", ResponseCache()):
+            provider.make_chat_completion_request(
+                messages, "gpt-4o-2024-08-06", temperature=0
+            )
+            provider.make_chat_completion_request(
+                messages, "gpt-4o-2024-08-06", temperature=0
+            )
+
+        self.assertEqual(mock_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1231,6 +1231,84 @@ class TestProviders(unittest.TestCase):
         self.assertEqual(res.error_info.get("type"), "api_error")
         self.assertIn("Bad request", res.error_info.get("message", ""))
 
+    @patch("urllib3.PoolManager.request")
+    def test_openai_preconnect_warms_pool(self, mock_request):
+        """preconnect() should issue a cheap GET and report success."""
+
+        class U3Resp:
+            status = 200
+            data = b"{}"
+
+        mock_request.return_value = U3Resp()
+
+        provider = get_provider("openai")
+        self.assertTrue(provider.preconnect())
+        self.assertTrue(mock_request.call_args.args[1].endswith("/models"))
+
+        mock_request.side_effect = Exception("Connection refused")
+        self.assertFalse(provider.preconnect())
+
+    @patch("urllib3.PoolManager.request")
+    def test_map_chat_completions_preserves_order(self, mock_request):
+        """Concurrent fan-out must return responses in batch order."""
+
+        def respond(method, url, **kwargs):
+            body = json.loads(kwargs["body"])
+            text = body["messages"][0]["content"]
+            payload = {
+                "id": "cmpl",
+                "model": body["model"],
+                "choices": [
+                    {"message": {"content": f"echo:{text}"}, "finish_reason": "stop"}
+                ],
+            }
+
+            class U3Resp:
+                status = 200
+                data = json.dumps(payload).encode("utf-8")
+
+            return U3Resp()
+
+        mock_request.side_effect = respond
+
+        provider = get_provider("openai")
+        batches = [[{"role": "user", "content": f"q{i}"}] for i in range(5)]
+        results = provider.map_chat_completions(
+            batches, "gpt-4o-2024-08-06", max_workers=3
+        )
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(
+            [r.standardized_response["content"] for r in results],
+            [f"echo:q{i}" for i in range(5)],
+        )
+
+    def test_openai_header_cache_revalidates_on_key_rotation(self):
+        """Cached headers must be rebuilt when the API key changes."""
+        provider = get_provider("openai")
+        first = provider._build_request_headers()
+        self.assertIs(provider._build_request_headers(), first)
+
+        provider._api_key = "rotated-key"
+        rotated = provider._build_request_headers()
+        self.assertEqual(rotated["Authorization"], "Bearer rotated-key")
+        self.assertEqual(
+            provider._build_stream_request_headers()["Authorization"],
+            "Bearer rotated-key",
+        )
+
+    def test_stream_header_cache_revalidates_with_overridden_builder(self):
+        """Stream headers must refresh even when the base builder is overridden."""
+        provider = get_provider("google_agent_platform")
+        first = provider._build_stream_request_headers()
+        self.assertEqual(first["x-goog-api-key"], "mock-google-agent-platform-key")
+        self.assertEqual(first["Accept"], "text/event-stream")
+        self.assertIs(provider._build_stream_request_headers(), first)
+
+        provider._api_key = "rotated-agent-key"
+        rotated = provider._build_stream_request_headers()
+        self.assertEqual(rotated["x-goog-api-key"], "rotated-agent-key")
+
     @patch("urllib3.PoolManager.request")
     def test_openai_style_customizable_subclass(self, mock_request):
         """Ensure subclasses can override headers and defaults."""
@@ -1570,6 +1648,58 @@ class TestProviders(unittest.TestCase):
             },
         )
 
+        # Compressed responses should be requested (urllib3 decodes them)
+        request_headers = mock_request.call_args.kwargs["headers"]
+        self.assertEqual(request_headers["Accept-Encoding"], "gzip, deflate")
+
+    @patch("urllib3.PoolManager.request")
+    def test_google_url_cache_revalidates_on_key_rotation(self, mock_request):
+        """Cached request URLs must be rebuilt when the API key changes."""
+
+        class U3Resp:
+            def __init__(self, status, data):
+                self.status = status
+                self.data = json.dumps(data).encode("utf-8")
+
+        mock_request.return_value = U3Resp(
+            200,
+            {
+                "candidates": [
+                    {
+                        "content": {"parts": [{"text": "ok"}], "role": "model"},
+                        "finishReason": "STOP",
+                    }
+                ]
+            },
+        )
+
+        provider = get_provider("google")
+        messages = [{"role": "user", "content": "Test message"}]
+        provider.make_chat_completion_request(messages=messages, model_id="gemini-1.5-pro")
+        first_url = mock_request.call_args.args[1]
+        self.assertIn("key=mock-gemini-key", first_url)
+
+        provider._api_key = "rotated-google-key"
+        provider.make_chat_completion_request(messages=messages, model_id="gemini-1.5-pro")
+        rotated_url = mock_request.call_args.args[1]
+        self.assertIn("key=rotated-google-key", rotated_url)
+
+    def test_google_fast_path_body_matches_full_serialization(self):
+        """Spliced fast-path bodies parse to the same payload as dict dumps."""
+        provider = get_provider("google")
+        contents = [{"parts": [{"text": "hi"}]}]
+
+        fast = json.loads(provider._build_request_body(contents, {}))
+        full = json.loads(
+            provider._build_request_body(contents, {"temperature": 0.5})
+        )
+
+        self.assertEqual(fast["contents"], contents)
+        self.assertEqual(fast["safetySettings"], full["safetySettings"])
+        self.assertNotIn("temperature", fast)
+        self.assertEqual(full["contents"], contents)
+        self.assertEqual(full["temperature"], 0.5)
+
     @patch("urllib3.PoolManager.request")
     def test_google_content_filter(self, mock_request):
         """Test Google content filter handling"""
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from llm_client import retry_request, LLMResponse
 from llm_client.base import LLMProvider
+from llm_client.retry import _canonicalize_messages
 
 
 class MockProvider(LLMProvider):
@@ -277,6 +278,27 @@ class TestRetryMechanism(unittest.TestCase):
 
         mock_logger.info.assert_called()
 
+    def test_canonicalize_messages_stable_key_order(self):
+        """Messages with equivalent keys serialize identically after canonicalization."""
+        a = _canonicalize_messages(
+            [{"content": "hi", "role": "user", "name": "alice"}]
+        )
+        b = _canonicalize_messages(
+            [{"name": "alice", "role": "user", "content": "hi"}]
+        )
+        self.assertEqual(list(a[0].keys()), ["role", "content", "name"])
+        self.assertEqual(list(a[0].keys()), list(b[0].keys()))
+        self.assertEqual(a, b)
+
+    def test_canonicalize_messages_preserves_content_and_order(self):
+        """Canonicalization must not touch message order or content."""
+        messages = [
+            {"role": "system", "content": "be brief  "},
+            {"role": "user", "content": "hello\n"},
+        ]
+        canonical = _canonicalize_messages(messages)
+        self.assertEqual(canonical, messages)
+
     def test_retry_request_passes_request_format_to_provider(self):
         """retry_request dispatches through make_request with request_format."""
 
@@ -84,6 +84,41 @@ class TestStreamingTransport(unittest.TestCase):
         self.assertTrue(res.success)
         self.assertEqual(res.standardized_response.get("content"), "Hello world")
 
+    @patch("urllib3.PoolManager.request")
+    def test_openai_iter_chat_completion_yields_pieces_then_response(
+        self, mock_request
+    ):
+        class FakeU3Resp:
+            status = 200
+
+            def stream(self, amt=65536, decode_content=True):
+                lines = [
+                    b'data: {"id":"s1","object":"chat.completion.chunk","created":1,"model":"gpt-4o-2024-08-06","choices":[{"delta":{"content":"Hello "},"index":0}]}\n',
+                    b'data: {"id":"s1","object":"chat.completion.chunk","created":1,"model":"gpt-4o-2024-08-06","choices":[{"delta":{"content":"world"},"index":0,"finish_reason":"stop"}]}\n',
+                    b"data: [DONE]\n",
+                ]
+                for b in lines:
+                    yield b
+
+            def close(self):
+                return None
+
+        mock_request.return_value = FakeU3Resp()
+
+        provider = get_provider("openai")
+        items = list(
+            provider.iter_chat_completion(
+                messages=[{"role": "user", "content": "Hi"}],
+                model_id="gpt-4o-2024-08-06",
+            )
+        )
+
+        # Content pieces arrive incrementally, then exactly one final response.
+        self.assertEqual(items[:-1], ["Hello ", "world"])
+        final = items[-1]
+        self.assertTrue(final.success)
+        self.assertEqual(final.standardized_response.get("content"), "Hello world")
+
     @patch("urllib3.PoolManager.request")
     def test_openrouter_streaming_aggregates_chunks(self, mock_request):
         class FakeU3Resp: